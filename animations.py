@@ -0,0 +1,94 @@
+# animations.py
+
+import time
+
+from config import ANIM_FPS, ANIM_MAX_ACTIVE
+from instrument import timed
+
+
+class AnimationTicker:
+    """
+    Jeden zegar animacji dla całej aplikacji: JEDNO after co 1000/fps ms
+    (tylko gdy coś się animuje) przesuwa wszystkie aktywne efekty.
+
+    Efekt to obiekt z metodami:
+      step(ms_od_startu) -> bool  – rysuje klatkę; False = koniec,
+      visible() -> bool           – czy widać go na ekranie,
+      stop()                      – sprząta (wołane zawsze na końcu).
+    Efekty niewidoczne (wiersz przewinięty / schowany) są od razu kończone,
+    a ponad max_active najstarszy ustępuje nowemu.
+    """
+
+    def __init__(self, root, fps: int = ANIM_FPS, max_active: int = ANIM_MAX_ACTIVE):
+        self.root = root
+        self._interval = max(1, round(1000 / fps))
+        self.max_active = max_active
+        self._effects = {}   # klucz (np. wiersz) -> (efekt, start); kolejność = od najstarszego
+        self._after_id = None
+
+    def start(self, key, effect):
+        """Uruchamia efekt pod kluczem (poprzedni efekt tego klucza kończy się)."""
+        self.cancel(key)
+        while len(self._effects) >= self.max_active:
+            self.cancel(next(iter(self._effects)))
+        self._effects[key] = (effect, time.perf_counter())
+        effect.step(0)
+        if self._after_id is None:
+            self._after_id = self.root.after(self._interval, self._tick)
+
+    def cancel(self, key):
+        entry = self._effects.pop(key, None)
+        if entry is not None:
+            entry[0].stop()
+
+    def clear(self):
+        for key in list(self._effects):
+            self.cancel(key)
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def __len__(self) -> int:
+        return len(self._effects)
+
+    @timed("anim.tick")
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        for key, (effect, start) in list(self._effects.items()):
+            if not effect.visible() or not effect.step((now - start) * 1000):
+                self.cancel(key)
+        if self._effects:
+            self._after_id = self.root.after(self._interval, self._tick)
+
+
+class Blink:
+    """
+    Mruganie kolorem tekstu widgetu: colors() -> (kolor A, kolor B) na zmianę
+    co period_ms, razem `times` zmian; potem on_done(). colors() jest
+    wołane przy każdej zmianie, więc mruganie idzie za bieżącym motywem.
+    """
+
+    def __init__(self, widget, colors, times: int = 6, period_ms: int = 120, on_done=None):
+        self.widget = widget
+        self.colors = colors
+        self.times = times
+        self.period_ms = period_ms
+        self.on_done = on_done
+        self._phase = None
+
+    def step(self, elapsed_ms: float) -> bool:
+        phase = int(elapsed_ms // self.period_ms)
+        if phase >= self.times:
+            return False
+        if phase != self._phase:  # konfigurujemy tylko przy zmianie koloru, nie w każdej klatce
+            self._phase = phase
+            self.widget.configure(fg=self.colors()[phase % 2])
+        return True
+
+    def visible(self) -> bool:
+        return bool(self.widget.winfo_ismapped())
+
+    def stop(self):
+        if self.on_done is not None:
+            self.on_done()
@@ -1,32 +1,47 @@
 import json
-import os
 import sys
-import ctypes
+import time
+from functools import partial
 from pathlib import Path
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 import tkinter as tk
-from tkinter import messagebox
 
-from config import PLIK, PALETA, CATEGORIES, sizes, style_button
-from task_row import TaskRow
+from config import (
+    PLIK, THEMES, CATEGORIES, BACKUP_INTERVAL_MS, STARTUP_FALLBACK_MS,
+    LOAD_CHUNK, LOAD_SLICE_MS, RENDER_MODE, SAVE_STATUS_MS, sizes,
+)
+from store import TaskStore
+from task_list import VirtualTaskList
 import db  # baza SQLite
+import backup
+import fonts
+import styles
+import instrument
+import startup
+from stall_watchdog import StallWatchdog
+from saver import WriteBehindSaver
+from reminders import ReminderScheduler
+from animations import AnimationTicker
 from powtarzanie import (
     REPEAT_OPTIONS,
     fmt_ddmm,
-    meta_to_ddmm_date,
-    generate_repeats,
+    fmt_hhmm,
+    parse_hhmm,
 )
 
 
 class TodoApp:
     def __init__(self, root):
         self.root = root
-        self.c = PALETA
+        self.c = styles.palette()  # wspólna paleta – zmiana motywu podmienia w niej kolory
         self.zoomed = False  # tylko wpływa na rozmiary fontów
-        self.tasks = []
-        self._row_toggle = False
         self.filter_mode = "all"  # all | today | tomorrow
-        self._seq = 0             # kolejność tworzenia
+        self._view_dirty = False
+        self._changed_since_backup = False
+        self._loaded = False      # zadania wczytują się po pierwszym narysowaniu okna
+        self._notifier = None     # NotificationDispatcher – tworzony przy pierwszym powiadomieniu
+        self._loading = None      # generator TaskStore.load_iter, dopóki wiersze dochodzą
+        self._load_total = 0
 
         # fullscreen state (nasz własny fullscreen bez ramek)
         self._fullscreen = False
@@ -43,22 +58,88 @@ class TodoApp:
         root.bind("<F11>", self._on_f11)
         root.bind("<Escape>", self._on_escape)
 
-        # Inicjalizacja bazy SQLite
-        db.init_db()  # tworzy bazę/tabelę, jeśli ich nie ma
+        # Zoom (większe / mniejsze czcionki)
+        root.bind("<Control-plus>", lambda _e: self.set_zoom(True))
+        root.bind("<Control-equal>", lambda _e: self.set_zoom(True))
+        root.bind("<Control-minus>", lambda _e: self.set_zoom(False))
+
+        # Ukryte: pomiary czasu (instrument.py) – Ctrl+Alt+I włącza/wyłącza, Ctrl+Alt+D zapisuje raport
+        root.bind("<Control-Alt-i>", self._toggle_instrumentation)
+        root.bind("<Control-Alt-d>", self._dump_instrumentation)
+
+        # zapis w tle (baza otwiera się dopiero na wątku zapisu / przy load)
+        self._save_error = None  # ostatni błąd zapisu (ustawia wątek zapisu, czyta _check_save_status)
+        self._saver = WriteBehindSaver(
+            self._write_changes, on_stop=db.close_connection, on_error=self._on_save_error,
+        )
 
+        # model bez Tk (store.py): zadania, indeks dat, serie; widok rysuje z niego.
+        # Id nadajemy sami – od największego id w bazie (ustawiane w _startup_load).
+        self.store = TaskStore(on_save=self._submit_changes)
+        self.store.subscribe(self._on_store_event)
+
+        # przypomnienia o godzinie: kopiec terminów + jedno after na najbliższy
+        self._reminders = ReminderScheduler(root, self._on_reminders_due)
+        # zacięcia pętli Tk – działa razem z pomiarami (MAJA_PROFILE / Ctrl+Alt+I)
+        self._watchdog = StallWatchdog(root)
+        # animacje wierszy: jeden zegar (ANIM_FPS) zamiast osobnych after w każdym wierszu
+        self._animations = AnimationTicker(root)
+
+        # najpierw pusta "skorupa" okna, baza i zadania – po pierwszym narysowaniu
         self._build_ui()
+        startup.mark("ui")
+        self._schedule_startup_load()
+
+        # o północy okno serii przesuwa się o dzień
+        self._schedule_day_change()
+
+        # kopia zapasowa bazy co BACKUP_INTERVAL_MS (jeśli coś się zmieniło) i przy wyjściu
+        self.root.after(BACKUP_INTERVAL_MS, self._backup_tick)
+        self.root.after(SAVE_STATUS_MS, self._check_save_status)
+
+        if instrument.enabled():
+            self._watchdog.start()
+
+    # ================== START ==================
+    def _schedule_startup_load(self):
+        """
+        Wczytanie zadań czeka na pierwsze narysowanie okna (<Expose>),
+        żeby użytkownik od razu widział aplikację. Awaryjnie (okno
+        zminimalizowane / bez Expose) – po STARTUP_FALLBACK_MS.
+        """
+        self._expose_bind = self.root.bind("<Expose>", self._on_first_expose, add="+")
+        self._fallback_id = self.root.after(STARTUP_FALLBACK_MS, self._startup_load)
+
+    def _on_first_expose(self, _e=None):
+        # <Expose> przychodzi przed rysowaniem – ładujemy, gdy Tk skończy bieżące zdarzenia
+        self.root.after_idle(self._startup_load)
+
+    def _startup_load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        startup.mark("first_paint")
+        self.root.unbind("<Expose>", self._expose_bind)
+        self.root.after_cancel(self._fallback_id)
+
+        self._fresh_db = db.init_db()  # tworzy bazę/tabelę, jeśli ich nie ma
+        self.store.reserve_ids(db.max_task_id() + 1, db.max_series_id() + 1)
         try:
             self.load(silent=True)
         except Exception:
-            pass
-
-        # konfiguracja powiadomień
-        # co ile MILISEKUND mają być przypomnienia (tu: 30 minut)
-        self._reminder_interval_ms = 30 * 60 * 1000
+            self._loading = None
+            self._loading_done()
+        self._enable_adding()
 
-        # pierwsze przypomnienie po kilku sekundach od startu,
-        # żeby łatwiej było zobaczyć, że działa
-        self._start_reminders(first_delay_ms=10_000)
+    def _enable_adding(self):
+        """
+        Pierwszy krok load_iter() już minął (load() robi go od razu), więc store
+        nadaje nowym zadaniom id i kolejność za wczytywanymi wierszami – można
+        dodawać, także zanim reszta dużego planu dojdzie kawałkami.
+        """
+        self.btn_add.configure(state="normal")
+        self.entry.bind("<Return>", self._add_from_enter)
+        self.time_entry.bind("<Return>", self._add_from_enter)
 
     def _setup_app_icon(self):
         """
@@ -73,6 +154,7 @@ class TodoApp:
 
             if sys.platform.startswith("win"):
                 try:
+                    import ctypes  # tylko Windows – nie ładujemy go na starcie wszędzie
                     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("MajaPlanner.PlanerMaji")
                 except Exception:
                     pass
@@ -96,56 +178,72 @@ class TodoApp:
             pass  # brak ikony nie blokuje działania
 
     # ================== POWIADOMIENIA ==================
-    def _start_reminders(self, first_delay_ms: int | None = None):
-        """Uruchamia cykliczne przypomnienia."""
-        if first_delay_ms is None:
-            first_delay_ms = self._reminder_interval_ms
-        self.root.after(first_delay_ms, self._reminder_tick)
-
-    def _reminder_tick(self):
+    def _today_summary(self):
         """
-        Co jakiś czas sprawdza zadania na dziś, które NIE są zrobione,
-        i wysyła powiadomienie typu:
+        Jednorazowo (po wczytaniu zadań) wysyła powiadomienie z zadaniami na dziś,
+        które NIE są zrobione, np.:
         'Dzisiejsze zadania: sprzątnij pokój, odrób matmę...'
+        Dalej przypominają już tylko zadania z godziną (ReminderScheduler).
         """
         today = date.today()
         texts = []
 
-        for r in self.tasks:
-            if not r.is_done():
-                md = meta_to_ddmm_date(r.get_meta())
-                if md == today:
-                    txt = r.get_text().strip()
-                    if txt:
-                        texts.append("• " + txt)
+        for t in self.store.on(today):
+            if not t.is_done():
+                txt = t.get_text().strip()
+                if txt:
+                    texts.append("• " + txt)
 
         if texts:
             msg = "Dzisiejsze zadania:\n\n" + "\n".join(texts)
             self._show_notification("Przypomnienie – Planer Maji", msg)
 
-        # znowu po ustalonym czasie
-        self.root.after(self._reminder_interval_ms, self._reminder_tick)
+    def _reminder_at(self, task):
+        """Kiedy przypomnieć o zadaniu (data + godzina) albo None."""
+        if not task.get_time() or task.due is None or task.is_done():
+            return None
+        t = parse_hhmm(task.get_time())
+        return datetime.combine(task.due, t) if t is not None else None
+
+    def _update_reminder(self, task):
+        self._reminders.schedule(task, self._reminder_at(task))
+
+    def _on_reminders_due(self, tasks):
+        """Wołane przez ReminderScheduler, gdy minęła godzina przypomnienia."""
+        texts = [
+            f"• {t.get_time()} {t.get_text().strip()}"
+            for t in sorted(tasks, key=lambda t: t.get_time())
+            if t in self.store
+        ]
+        if texts:
+            self._show_notification("Przypomnienie – Planer Maji", "\n".join(texts))
 
     def _show_notification(self, title: str, message: str):
         """
-        Próbuje wysłać powiadomienie systemowe (Windows),
-        a jeśli się nie uda – pokazuje zwykły popup (messagebox).
+        Oddaje powiadomienie do NotificationDispatcher: toast w rogu okna
+        (bez modalnego popupu) + powiadomienie systemowe na osobnym wątku.
+        Nie blokuje listy zadań; powtórzone przypomnienie pokaże się raz.
         """
-        try:
-            # spróbuj użyć powiadomień Windows (jeśli jest zainstalowane win10toast)
-            from win10toast import ToastNotifier  # type: ignore
+        if self._notifier is None:
+            # backendy (notify-send, win10toast...) ładujemy dopiero, gdy są potrzebne
+            from notifications import NotificationDispatcher, default_backends
+            self._notifier = NotificationDispatcher(default_backends(self.root))
+        self._notifier.notify(title, message)
+
+    # ================== POMIARY ==================
+    def _toggle_instrumentation(self, _e=None):
+        """Włącza/wyłącza pomiary czasu i watchdog zacięć (raport: Ctrl+Alt+D)."""
+        instrument.enable(not instrument.enabled())
+        if instrument.enabled():
+            self._watchdog.start()
+        else:
+            self._watchdog.stop()
+        state = "włączone" if instrument.enabled() else "wyłączone"
+        self._show_notification("Pomiary – Planer Maji", f"Pomiary czasu {state}.")
 
-            if not hasattr(self, "_toaster"):
-                self._toaster = ToastNotifier()
-            # threaded=True żeby nie blokować aplikacji
-            self._toaster.show_toast(title, message, duration=10, threaded=True)
-        except Exception:
-            # jeśli nie ma win10toast albo coś pójdzie nie tak – zwykły popup
-            try:
-                messagebox.showinfo(title, message)
-            except Exception:
-                # jak nawet popup się nie uda, to już nic nie robimy
-                pass
+    def _dump_instrumentation(self, _e=None):
+        path = instrument.dump()
+        self._show_notification("Pomiary – Planer Maji", f"Raport: {path}")
 
     # ================== FULLSCREEN ==================
     def _on_f11(self, _e=None):
@@ -180,181 +278,226 @@ class TodoApp:
             if hasattr(self, "btn_fullscreen"):
                 self.btn_fullscreen.configure(text="Pełny ekran")
 
+    # ================== ZOOM ==================
+    @instrument.action("zoom")
+    def set_zoom(self, zoomed: bool):
+        """
+        Przełącza rozmiary z sizes(zoomed) BEZ przebudowy UI:
+        wspólne fonty (fonts.py) zmieniają się w miejscu, a lista tylko
+        mierzy wiersze na nowo.
+        """
+        if zoomed == self.zoomed:
+            return
+        self.zoomed = zoomed
+        s = sizes(zoomed)
+        fonts.use_sizes(s)
+        self.entry.grid_configure(ipady=(9 if zoomed else 7))
+        self.task_list.set_sizes(s)
+
+    # ================== MOTYW ==================
+    @instrument.action("theme")
+    def set_theme(self, name: str):
+        """
+        Zmienia motyw BEZ przebudowy UI: styles.use_theme() podmienia kolory
+        w palecie (self.c) i przestylowuje zapisane widgety, a lista zadań
+        rysuje widoczne wiersze od nowa.
+        """
+        styles.use_theme(name)
+        self.theme_var.set(name)
+
     # ================== UI ==================
     def _build_ui(self):
-        c = self.c
+        """
+        Buduje okno RAZ. Zoom i motyw nie przebudowują go: fonty (fonts.py)
+        i kolory (styles.py) zmieniają się w miejscu w zapisanych widgetach.
+        """
         s = sizes(self.zoomed)
-        self.root.configure(bg=c["BG"])
-        for w in self.root.winfo_children():
-            w.destroy()
+        fonts.use_sizes(s)
+        bind = styles.bind
+        bind(self.root, bg="BG")
 
         # Pasek tytułu
-        ribbon = tk.Frame(self.root, bg=c["RIBBON"])
+        ribbon = bind(tk.Frame(self.root), bg="RIBBON")
         ribbon.pack(fill="x")
-        tk.Label(
+        bind(tk.Label(
             ribbon,
             text="Planer Maji",
-            bg=c["RIBBON"],
             fg="white",
-            font=("Segoe UI", s["title"], "bold")
-        ).pack(padx=12, pady=(10, 2))
-        tk.Label(
+            font=fonts.get("title")
+        ), bg="RIBBON").pack(padx=12, pady=(10, 2))
+        bind(tk.Label(
             ribbon,
             text="Planuj i odhaczaj",
-            bg=c["RIBBON"],
             fg="#D8D9E6",
-            font=("Segoe UI", s["subtitle"])
-        ).pack(padx=12, pady=(0, 10))
+            font=fonts.get("subtitle")
+        ), bg="RIBBON").pack(padx=12, pady=(0, 10))
 
         # Karta dodawania
-        card_add = tk.Frame(
-            self.root,
-            bg=c["CARD"],
-            highlightbackground=c["BORDER"],
-            highlightcolor=c["BORDER"],
-            highlightthickness=2
+        card_add = bind(
+            tk.Frame(self.root, highlightthickness=2),
+            bg="CARD", highlightbackground="BORDER", highlightcolor="BORDER",
         )
         card_add.pack(fill="x", padx=14, pady=8)
 
-        tk.Label(
+        bind(tk.Label(
             card_add,
             text="Nowe zadanie:",
-            bg=c["CARD"],
-            fg=c["TEXT"],
-            font=("Segoe UI", s["task"], "bold")
-        ).grid(row=0, column=0, sticky="w", padx=10, pady=(10, 0))
+            font=fonts.get("task")
+        ), bg="CARD", fg="TEXT").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 0))
 
-        self.entry = tk.Entry(
-            card_add,
-            bg=c["ENTRY_BG"],
-            fg=c["TEXT"],
-            insertbackground=c["TEXT"],
-            relief="flat",
-            highlightthickness=2,
-            highlightbackground=c["BORDER"],
-            highlightcolor=c["ACCENT"],
-            font=("Segoe UI", s["entry"])
+        self.entry = bind(
+            tk.Entry(card_add, relief="flat", highlightthickness=2, font=fonts.get("entry")),
+            bg="ENTRY_BG", fg="TEXT", insertbackground="TEXT",
+            highlightbackground="BORDER", highlightcolor="ACCENT",
         )
         self.entry.grid(
             row=1, column=0, columnspan=6, sticky="ew",
             padx=10, pady=8, ipady=(9 if self.zoomed else 7)
         )
         card_add.columnconfigure(0, weight=1)
-        self.entry.bind("<Return>", self._add_from_enter)
 
-        tk.Label(
+        bind(tk.Label(
             card_add,
             text="Kategoria:",
-            bg=c["CARD"], fg=c["TEXT"],
-            font=("Segoe UI", s["subtitle"], "bold")
-        ).grid(row=2, column=0, sticky="w", padx=10)
+            font=fonts.get("subtitle_bold")
+        ), bg="CARD", fg="TEXT").grid(row=2, column=0, sticky="w", padx=10)
         self.cat_var = tk.StringVar(value=CATEGORIES[0])
         self.cat_menu = tk.OptionMenu(card_add, self.cat_var, *CATEGORIES)
-        self.cat_menu.configure(
-            bg=c["CARD_2"], fg=c["TEXT"], activebackground=c["CARD"],
-            bd=0, highlightthickness=0
-        )
+        self.cat_menu.configure(bd=0, highlightthickness=0)
+        bind(self.cat_menu, bg="CARD_2", fg="TEXT", activebackground="CARD")
         self.cat_menu.grid(row=2, column=1, sticky="w", padx=(6, 12), pady=(0, 8))
 
-        tk.Label(
+        bind(tk.Label(
             card_add,
             text="Powtarzanie:",
-            bg=c["CARD"], fg=c["TEXT"],
-            font=("Segoe UI", s["subtitle"], "bold")
-        ).grid(row=2, column=2, sticky="e")
+            font=fonts.get("subtitle_bold")
+        ), bg="CARD", fg="TEXT").grid(row=2, column=2, sticky="e")
         self.repeat_var = tk.StringVar(value=REPEAT_OPTIONS[0])
         self.repeat_menu = tk.OptionMenu(card_add, self.repeat_var, *REPEAT_OPTIONS)
-        self.repeat_menu.configure(
-            bg=c["CARD_2"], fg=c["TEXT"], activebackground=c["CARD"],
-            bd=0, highlightthickness=0
-        )
+        self.repeat_menu.configure(bd=0, highlightthickness=0)
+        bind(self.repeat_menu, bg="CARD_2", fg="TEXT", activebackground="CARD")
         self.repeat_menu.grid(row=2, column=3, sticky="w", padx=(6, 12), pady=(0, 8))
 
+        bind(tk.Label(
+            card_add,
+            text="Godzina:",
+            font=fonts.get("subtitle_bold")
+        ), bg="CARD", fg="TEXT").grid(row=2, column=4, sticky="e")
+        self.time_entry = bind(
+            tk.Entry(card_add, width=6, relief="flat", highlightthickness=2, font=fonts.get("entry")),
+            bg="ENTRY_BG", fg="TEXT", insertbackground="TEXT",
+            highlightbackground="BORDER", highlightcolor="ACCENT",
+        )
+        self.time_entry.grid(row=2, column=5, sticky="w", padx=(6, 10), pady=(0, 8))
+
         # Pasek przycisku "Dodaj"
-        btn_row = tk.Frame(self.root, bg=c["CARD"])
+        btn_row = bind(tk.Frame(self.root), bg="CARD")
         btn_row.pack(fill="x", padx=24, pady=(0, 10))
-        self.btn_add = tk.Button(btn_row, text="Dodaj", command=self.add_task)
-        style_button(self.btn_add, c, primary=True, fsize=s["button"])
+        # "Dodaj" i Enter działają dopiero po otwarciu bazy (_enable_adding)
+        self.btn_add = tk.Button(btn_row, text="Dodaj", command=self.add_task, state="disabled")
+        styles.button(self.btn_add, primary=True, font=fonts.get("button"))
         self.btn_add.pack(side="left")
 
         # Filtry
-        filter_row = tk.Frame(self.root, bg=c["CARD"])
+        filter_row = bind(tk.Frame(self.root), bg="CARD")
         filter_row.pack(fill="x", padx=14, pady=(0, 8))
         self.btn_all = tk.Button(filter_row, text="Wszystkie", command=lambda: self._filter_click("all"))
-        style_button(self.btn_all, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_all, primary=False, font=fonts.get("button"))
         self.btn_all.pack(side="left")
         self.btn_today = tk.Button(filter_row, text="Dzisiaj", command=lambda: self._filter_click("today"))
-        style_button(self.btn_today, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_today, primary=False, font=fonts.get("button"))
         self.btn_today.pack(side="left", padx=6)
         self.btn_tomorrow = tk.Button(filter_row, text="Jutro", command=lambda: self._filter_click("tomorrow"))
-        style_button(self.btn_tomorrow, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_tomorrow, primary=False, font=fonts.get("button"))
         self.btn_tomorrow.pack(side="left", padx=6)
 
+        # Motyw (kolory zmieniają się w miejscu – patrz set_theme)
+        self.theme_var = tk.StringVar(value=styles.theme())
+        self.theme_menu = tk.OptionMenu(filter_row, self.theme_var, *THEMES, command=self.set_theme)
+        self.theme_menu.configure(bd=0, highlightthickness=0, font=fonts.get("button"))
+        bind(self.theme_menu, bg="CARD_2", fg="TEXT", activebackground="CARD")
+        self.theme_menu.pack(side="right")
+        bind(tk.Label(
+            filter_row, text="Motyw:", font=fonts.get("subtitle_bold")
+        ), bg="CARD", fg="TEXT").pack(side="right", padx=6)
+
         # Scrollowana lista zadań
-        card_list = tk.Frame(
-            self.root, bg=c["CARD_2"],
-            highlightbackground=c["BORDER"], highlightcolor=c["BORDER"], highlightthickness=2
+        card_list = bind(
+            tk.Frame(self.root, highlightthickness=2),
+            bg="CARD_2", highlightbackground="BORDER", highlightcolor="BORDER",
         )
         card_list.pack(fill="both", expand=True, padx=14, pady=8)
 
-        self.list_title = tk.Label(
-            card_list, text="Twoja lista zadań:",
-            bg=c["CARD_2"], fg=c["TEXT"], font=("Segoe UI", s["task"], "bold")
+        title_row = bind(tk.Frame(card_list), bg="CARD_2")
+        title_row.pack(fill="x", padx=10, pady=(10, 6))
+        self.list_title = bind(
+            tk.Label(title_row, text="Twoja lista zadań:", font=fonts.get("task")),
+            bg="CARD_2", fg="TEXT",
+        )
+        self.list_title.pack(side="left")
+        # "Wczytywanie… 40%" – widoczne tylko, gdy duży plan dochodzi kawałkami
+        self.load_progress = bind(
+            tk.Label(title_row, text="", font=fonts.get("subtitle")),
+            bg="CARD_2", fg="MUTED",
+        )
+        # "Nie udało się zapisać zmian…" – widoczne tylko, gdy zapis w tle zawodzi
+        self.save_status = bind(
+            tk.Label(title_row, text="", font=fonts.get("subtitle"), fg="#E05555"),
+            bg="CARD_2",
         )
-        self.list_title.pack(anchor="w", padx=10, pady=(10, 6))
 
-        scroll_wrap = tk.Frame(card_list, bg=c["CARD_2"])
+        scroll_wrap = bind(tk.Frame(card_list), bg="CARD_2")
         scroll_wrap.pack(fill="both", expand=True, padx=6, pady=(0, 10))
 
-        self.canvas = tk.Canvas(scroll_wrap, bg=c["CARD_2"], highlightthickness=0)
-        vbar = tk.Scrollbar(scroll_wrap, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=vbar.set)
+        self.canvas = bind(tk.Canvas(scroll_wrap, highlightthickness=0), bg="CARD_2")
+        vbar = tk.Scrollbar(scroll_wrap, orient="vertical")
         self.canvas.pack(side="left", fill="both", expand=True)
         vbar.pack(side="right", fill="y")
 
-        self.list_frame = tk.Frame(self.canvas, bg=c["CARD_2"])
-        self._list_window = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw")
-
-        self.list_frame.bind("<Configure>", lambda _e: self._update_scrollregion())
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(self._list_window, width=e.width))
+        # tylko widoczne wiersze są rysowane: jako widgety (VirtualTaskList)
+        # albo jako elementy canvasa (CanvasTaskList, MAJA_RENDER=canvas)
+        if RENDER_MODE == "canvas":
+            from canvas_list import CanvasTaskList as TaskListView
+        else:
+            TaskListView = VirtualTaskList
+        self.task_list = TaskListView(
+            self.canvas, vbar, self.c, s,
+            on_change=self.on_task_change,
+            on_star_toggle=self._on_star_toggled,
+            on_delete=self._on_row_deleted,
+            wheel_handler=self._on_mousewheel,
+            animator=self._animations,
+        )
         self._enable_mousewheel(self.canvas)
 
         # Dół z przyciskami akcji
-        bottom = tk.Frame(self.root, bg=c["BG"])
+        bottom = bind(tk.Frame(self.root), bg="BG")
         bottom.pack(fill="x", padx=14, pady=10)
 
         self.btn_remove_done = tk.Button(bottom, text="Usuń zaznaczone", command=self.remove_done)
-        style_button(self.btn_remove_done, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_remove_done, primary=False, font=fonts.get("button"))
         self.btn_remove_done.pack(side="left")
 
         self.btn_clear_all = tk.Button(bottom, text="Usuń wszystko", command=self.clear_all)
-        style_button(self.btn_clear_all, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_clear_all, primary=False, font=fonts.get("button"))
         self.btn_clear_all.pack(side="left", padx=6)
 
+        self.btn_export = tk.Button(bottom, text="Eksport JSON", command=self.export_json)
+        styles.button(self.btn_export, primary=False, font=fonts.get("button"))
+        self.btn_export.pack(side="left", padx=6)
+
         self.btn_fullscreen = tk.Button(bottom, text="Pełny ekran", command=self.toggle_fullscreen)
-        style_button(self.btn_fullscreen, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_fullscreen, primary=False, font=fonts.get("button"))
         self.btn_fullscreen.pack(side="left", padx=6)
 
         self.btn_exit = tk.Button(bottom, text="Wyjdź", command=self.exit_app)
-        style_button(self.btn_exit, c, primary=False, fsize=s["button"])
+        styles.button(self.btn_exit, primary=False, font=fonts.get("button"))
         self.btn_exit.pack(side="left", padx=6)
 
-        # Przywrócenie zadań po rebuildzie UI
-        if hasattr(self, "_pending_tasks"):
-            for item in self._pending_tasks:
-                self._add_row(
-                    item["text"], done=item["done"], cat=item.get("cat", "Inne"),
-                    meta=item.get("meta"), star=item.get("star", False),
-                    created_seq=item.get("created_seq"), is_repeat=item.get("rep", False),
-                )
-            self._pending_tasks = None
-
+        # Zadania są w self.store (model) – wystarczy je narysować
         self.apply_filter(self.filter_mode, update_title=True)
 
     # ================== Scroll i filtr ==================
-    def _update_scrollregion(self):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
     def _on_mousewheel(self, event):
         if event.num == 4:
             self.canvas.yview_scroll(-3, "units")
@@ -377,65 +520,73 @@ class TodoApp:
         self.apply_filter(mode, update_title=True)
 
     # ================== Dodawanie zadań ==================
+    @instrument.action("add")
     def add_task(self):
         base_text = self.entry.get().strip()
         if not base_text:
+            from tkinter import messagebox
             messagebox.showinfo("Uwaga", "Wpisz treść zadania.")
             return
 
+        # godzina przypomnienia (opcjonalna)
+        time_text = self.time_entry.get().strip()
+        remind_time = None
+        if time_text:
+            parsed = parse_hhmm(time_text)
+            if parsed is None:
+                from tkinter import messagebox
+                messagebox.showinfo("Uwaga", "Godzinę wpisz jako gg:mm, np. 17:30.")
+                return
+            remind_time = fmt_hhmm(parsed)
+
         cat = self.cat_var.get()
         pattern = self.repeat_var.get()
         today = date.today()
 
-        base_date_for_main = today
-        series_start_date = today
-
-        # główne zadanie (zawsze dzisiaj)
-        self._add_row(
-            base_text, done=False, cat=cat,
-            meta=fmt_ddmm(base_date_for_main), is_repeat=False
-        )
-
-        # automatyczne powtórzenia (też od dzisiaj)
-        for d in generate_repeats(pattern, series_start_date):
-            self._add_row(
-                base_text, done=False, cat=cat,
-                meta=fmt_ddmm(d), is_repeat=True
-            )
+        with self.store.batch():
+            if pattern == "Brak":
+                # zwykłe zadanie (zawsze dzisiaj)
+                self.store.add(
+                    base_text, cat=cat, meta=fmt_ddmm(today), due=today, time=remind_time
+                )
+            else:
+                # seria od dzisiaj: zapisana raz jako reguła, wystąpienia rozwijane na bieżąco
+                self.store.add_series(base_text, cat, pattern, today, time=remind_time)
 
         self.entry.delete(0, tk.END)
-        self.save(silent=True)
-        self._refresh_view()
+        self.time_entry.delete(0, tk.END)
 
     # Enter w polu tekstowym dodaje zadanie
     def _add_from_enter(self, _event=None):
         self.add_task()
 
     # ================== Widok / filtry ==================
-    def _matches_filter(self, row, mode=None):
-        if mode is None:
-            mode = self.filter_mode
-
-        today = date.today()
-        tomorrow = today + timedelta(days=1)
-        md = meta_to_ddmm_date(row.get_meta())
-
-        if mode == "all":
-            return True
-        if mode == "today":
-            return md == today
-        if mode == "tomorrow":
-            return md == tomorrow
-        return True
-
+    @instrument.timed("app.refresh_view")
     def _refresh_view(self):
-        for r in self.tasks:
-            r.hide()
-        for r in sorted(self.tasks, key=lambda r: (not r.get_starred(), r.created_seq)):
-            if self._matches_filter(r):
-                r.show()
-        self.root.after(10, self._update_scrollregion)
+        """
+        Kolejność jest utrzymywana na bieżąco (TaskOrder), więc tu nie sortujemy
+        całości – "Wszystkie" to gotowa lista, Dzisiaj/Jutro to mały koszyk.
+        Lista sama przestawia tylko te wiersze, które się zmieniły.
+        """
+        self._view_dirty = False
+        self.task_list.set_items(self.store.query(self.filter_mode))
 
+    def _on_store_event(self, event, task):
+        """
+        Zdarzenia z TaskStore: przypomnienia aktualizujemy od razu,
+        a widok odświeżamy raz – na końcu operacji ("committed").
+        """
+        if event == "committed":
+            if self._view_dirty:
+                self._refresh_view()
+            return
+        if event == "removed":
+            self._reminders.cancel(task)
+        else:
+            self._update_reminder(task)
+        self._view_dirty = True
+
+    @instrument.action("filter")
     def apply_filter(self, mode, update_title=True):
         self.filter_mode = mode
         self._refresh_view()
@@ -451,166 +602,224 @@ class TodoApp:
                 title = f"Jutrzejsze zadania ({tomorrow_str})"
             self.list_title.configure(text=title)
 
-    # ================== Operacje na wierszach ==================
-    def _add_row(self, text, done=False, cat="Inne", meta=None, star=False, created_seq=None, is_repeat=False):
-        s = sizes(self.zoomed)
-        row_color = self.c["CARD"] if self._row_toggle else self.c["CARD_2"]
-        self._row_toggle = not self._row_toggle
-
-        if created_seq is None:
-            created_seq = self._seq
-            self._seq += 1
-
-        row = TaskRow(
-            self.list_frame, text, cat,
-            on_change=self.on_task_change, c=self.c, s=s,
-            row_color=row_color, meta=meta, star=star, is_repeat=is_repeat,
-            on_delete=self._on_row_deleted, on_star_toggle=self._on_star_toggled
-        )
-        row.created_seq = created_seq
-        row.set_done(done)
-        self.tasks.append(row)
-
-        if self._matches_filter(row):
-            row.show()
-        else:
-            row.hide()
+    # ================== Operacje na zadaniach ==================
+    def _schedule_day_change(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((midnight - now).total_seconds() * 1000) + 1000
+        self.root.after(delay_ms, self._on_day_change)
+
+    @instrument.action("day_change")
+    def _on_day_change(self):
+        # o północy okno serii przesuwa się o dzień
+        self.store.advance_window()
+        self.apply_filter(self.filter_mode, update_title=True)
+        self._schedule_day_change()
 
-    def _on_row_deleted(self, row):
-        try:
-            self.tasks.remove(row)
-        except ValueError:
-            pass
-        self.save(silent=True)
-        self._refresh_view()
+    @instrument.action("delete")
+    def _on_row_deleted(self, task):
+        self.store.delete(task)
 
-    def _on_star_toggled(self, _row, _state):
-        self.save(silent=True)
-        self._refresh_view()
+    @instrument.action("star")
+    def _on_star_toggled(self, task, state):
+        self.store.star(task, state)
 
-    def on_task_change(self):
-        self.save(silent=True)
+    @instrument.action("toggle")
+    def on_task_change(self, task, done):
+        self.store.toggle(task, done)
 
+    @instrument.action("remove_done")
     def remove_done(self):
-        for r in list(self.tasks):
-            if r.is_done():
-                r.destroy()  # TaskRow.destroy wywoła _on_row_deleted
-        self.save(silent=True)
-        self._refresh_view()
+        self._finish_loading()  # dotyczy całej listy – także wierszy, które jeszcze nie doszły
+        self.store.delete_done()
 
+    @instrument.action("clear_all")
     def clear_all(self):
-        for r in list(self.tasks):
-            r.destroy()
-        self.tasks.clear()
-        self.save(silent=True)
-        self._refresh_view()
+        self._finish_loading()
+        self.store.clear()
 
-    # ================== CZYSZCZENIE STARYCH ZADAŃ ==================
-    def _cleanup_data_items(self, data: list[dict]) -> list[dict]:
+    # ================== Zapis / wczytanie ==================
+    # operacje hurtowe z TaskStore -> jedno polecenie SQL
+    _BULK_WRITES = {
+        "done": partial(db.delete_where, done=1),
+        "all": db.delete_all,
+    }
+
+    def _submit_changes(self, changes):
+        """Zmiany z TaskStore idą do zapisu w tle (nie blokuje interfejsu)."""
+        self._changed_since_backup = True
+        instrument.count_save()
+        # hurtowe usuwanie: przez call(), żeby wykonało się po wcześniejszych
+        # zmianach w kolejce, a przed resztą tej paczki (saver skleja klucze)
+        for key in [k for k in changes if k[0] == "bulk"]:
+            del changes[key]
+            self._saver.call(self._BULK_WRITES[key[1]])
+        self._saver.submit(changes)
+
+    def _on_save_error(self, error):
+        """WĄTEK ZAPISU: błąd zapisu albo None (znów działa) – Tk odczyta to w _check_save_status."""
+        self._save_error = error
+
+    def _check_save_status(self):
+        """Co SAVE_STATUS_MS: napis o nieudanym zapisie (saver sam go ponawia)."""
+        error = self._save_error
+        if error is None:
+            if self.save_status.winfo_ismapped():
+                self.save_status.pack_forget()
+        else:
+            self.save_status.configure(text=f"Nie udało się zapisać zmian ({error}) – ponawiam…")
+            if not self.save_status.winfo_ismapped():
+                self.save_status.pack(side="right", padx=(0, 8))
+        self.root.after(SAVE_STATUS_MS, self._check_save_status)
+
+    def _write_changes(self, changes):
         """
-        Usuwa zadania, które mają datę w meta wcześniejszą niż dzisiaj.
-        Zostają tylko:
-          • zadania bez daty (meta == None albo puste),
-          • zadania na dziś,
-          • zadania na przyszłość.
+        Wołane przez WriteBehindSaver na WĄTKU ZAPISU (bez dotykania Tk):
+        zapisuje paczkę zmian do bazy SQLite jednym commitem.
+        Kopie zapasowe robi osobno backup.snapshot() (co jakiś czas i przy wyjściu).
+        changes: {("tasks" | "series", id): dane albo None (= usuń)}
         """
-        today = date.today()
-        cleaned: list[dict] = []
-
-        for item in data:
-            meta = item.get("meta")
-            d = meta_to_ddmm_date(meta)
-
-            # jeśli nie ma daty albo nie udało się sparsować – zostaw
-            if d is None:
-                cleaned.append(item)
-                continue
-
-            # jeśli data jest w przeszłości – pomijamy (czyli "auto-usuwamy")
-            if d < today:
-                continue
-
-            cleaned.append(item)
-
-        return cleaned
+        upserts, deleted_ids, series_upserts, deleted_series_ids = [], [], [], []
+        for (table, item_id), data in changes.items():
+            if table == "series":
+                (series_upserts.append(data) if data is not None else deleted_series_ids.append(item_id))
+            else:
+                (upserts.append(data) if data is not None else deleted_ids.append(item_id))
+        db.write_batch(upserts, deleted_ids, series_upserts, deleted_series_ids)
 
-    # ================== Zapis / wczytanie ==================
+    @instrument.action("save")
     def save(self, silent=True):
         """
-        ZBIERA dane z TaskRow i:
-          1) zapisuje je do bazy SQLite (db.save_all)
-          2) dodatkowo zapisuje JSON (PLIK) jako backup (tak jak wcześniej)
+        Wymusza zapis: oddaje oczekujące zmiany i czeka, aż trafią do bazy.
+        Pojedyncze zmiany (checkbox, gwiazdka, usuwanie) zapisują się same w tle.
         """
-        data = [{
-            "text": r.get_text(),
-            "done": r.is_done(),
-            "cat": r.get_cat(),
-            "meta": r.get_meta(),
-            "star": r.get_starred(),
-            "created_seq": r.created_seq,
-            "rep": r.get_is_repeat(),
-        } for r in self.tasks]
-
-        # zapis do SQLite
-        db.save_all(data)
-
-        # dodatkowy zapis do JSON – żebyś miała kopię tak jak wcześniej
-        tmp = PLIK + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        os.replace(tmp, PLIK)
+        self._saver.flush()
+
+    def _backup_tick(self):
+        """Co BACKUP_INTERVAL_MS: kopia bazy na wątku zapisu, jeśli od ostatniej coś się zmieniło."""
+        self._request_backup()
+        self.root.after(BACKUP_INTERVAL_MS, self._backup_tick)
+
+    def _request_backup(self):
+        if self._changed_since_backup:
+            self._changed_since_backup = False
+            self._saver.call(backup.snapshot)
+
+    @instrument.action("export")
+    def export_json(self):
+        """Eksport na żądanie: zapisuje wszystko do PLIK (zwarty JSON)."""
+        if not self._loaded:
+            return  # baza jeszcze nieotwarta – nie nadpisujemy eksportu pustką
+        self.save()
+        try:
+            path = backup.export_json()
+        except Exception as e:
+            from tkinter import messagebox
+            messagebox.showerror("Eksport", f"Nie udało się zapisać pliku:\n{e}")
+            return
+        self._show_notification("Eksport – Planer Maji", f"Zapisano: {path}")
 
+    @instrument.action("load")
     def load(self, silent=False):
         """
         ŁADUJE zapisane zadania:
           - najpierw z bazy SQLite,
-          - jeśli tam pusto, próbuje z pliku JSON (PLIK).
-        Potem:
-          - usuwa zadania z datą w przeszłości (auto-czyszczenie),
-          - zapisuje odświeżoną listę zadań z powrotem.
+          - jeśli baza jest zupełnie nowa, próbuje z pliku JSON (PLIK):
+            stary backup (lista zadań) albo eksport {"tasks", "series"}.
+        Zadania z datą w przeszłości są usuwane (auto-czyszczenie): w bazie
+        jednym DELETE przed odczytem, więc wczytujemy tylko aktualne wiersze.
+        Zmiany (np. z importu JSON) wracają do bazy jednym commitem (batch()).
         """
-        # 1) Najpierw spróbuj z bazy
+        # 1) Najpierw spróbuj z bazy (bez zadań z przeszłości)
+        db.purge_before(date.today())
         data = db.load_all()
+        from_json = False
+
+        series_data = db.load_series()
 
-        # 2) Jeśli w bazie pusto – spróbuj z JSON (stara wersja)
-        if not data:
+        # 2) Jeśli baza dopiero powstała – spróbuj z JSON (stara wersja / eksport)
+        if self._fresh_db and not data and not series_data:
+            from_json = True
             try:
                 with open(PLIK, "r", encoding="utf-8") as f:
                     data = json.load(f)
             except Exception:
                 data = []
+            if isinstance(data, dict):
+                series_data = data.get("series", [])
+                data = data.get("tasks", [])
 
-        if not data:
+        if not data and not series_data:
+            self._loading_done()
             return
 
-        # 3) usuń zadania z datą w przeszłości
-        data = self._cleanup_data_items(data)
-
-        # 4) zbuduj widok na podstawie wyczyszczonych danych
-        for r in list(self.tasks):
-            r.destroy()
-        self.tasks.clear()
-
-        max_seq = -1
-        for item in data:
-            created_seq = item.get("created_seq")
-            if isinstance(created_seq, int):
-                max_seq = max(max_seq, created_seq)
-            self._add_row(
-                item.get("text", ""),
-                done=bool(item.get("done", False)),
-                cat=item.get("cat", "Inne"),
-                meta=item.get("meta"),
-                star=bool(item.get("star", False)),
-                created_seq=created_seq,
-                is_repeat=bool(item.get("rep", False)),
-            )
-        self._seq = max_seq + 1 if max_seq >= 0 else len(self.tasks)
-        self._refresh_view()
+        # 3) model od nowa, kawałkami: najpierw to, co bieżący filtr pokaże na górze
+        #    (wiersze wybranego dnia albo przypięte), reszta dochodzi w tle.
+        #    Import z JSON-a wraca do bazy – jeden commit na kawałek.
+        if not from_json:
+            if self.filter_mode == "all":
+                data.sort(key=lambda item: not item["star"])  # sort stabilny: reszta bez zmian
+            else:
+                day = date.today() + timedelta(days=1 if self.filter_mode == "tomorrow" else 0)
+                data.sort(key=lambda item: item["due_date"] != day.isoformat())
+        self._loading = self.store.load_iter(data, series_data, imported=from_json, chunk=LOAD_CHUNK)
+        self._load_total = len(data)
+        self._load_step()
+
+    @instrument.timed("app.load_step")
+    def _load_step(self):
+        """
+        Jeden kawałek wczytywania: kolejne porcje wierszy przez najwyżej
+        LOAD_SLICE_MS, jedno odświeżenie widoku, a potem oddajemy pętlę Tk
+        (klikanie, przewijanie, dodawanie) i wracamy przez after.
+        """
+        if self._loading is None:
+            return
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        loaded = 0
+        with self.store.batch():  # cały kawałek = jedno "committed" = jedno odświeżenie
+            for loaded in self._loading:
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                self._loading = None
+        if self._loading is None:
+            self._loading_done()
+            return
+        percent = loaded * 100 // max(self._load_total, 1)
+        self.load_progress.configure(text=f"Wczytywanie… {percent}%")
+        if not self.load_progress.winfo_ismapped():
+            self.load_progress.pack(side="right")
+        self.root.after(1, self._load_step)
+
+    def _finish_loading(self):
+        """Dociąga resztę wierszy od razu (przed operacjami na całej liście i wyjściem)."""
+        if self._loading is not None:
+            with self.store.batch():
+                for _loaded in self._loading:
+                    pass
+            self._loading = None
+            self._loading_done()
 
-        # 5) zapisz z powrotem po wyczyszczeniu (żeby baza/JSON też były odświeżone)
-        self.save(silent=True)
+    def _loading_done(self):
+        self.load_progress.pack_forget()
+        startup.mark("loaded")
+        startup.report()
+        # dopiero teraz store ma WSZYSTKIE zadania (także te, które doszły kawałkami)
+        self._today_summary()
 
     def exit_app(self):
-        self.save()
+        # import z JSON-a, który jeszcze nie doszedł do końca, musi trafić do bazy
+        self._finish_loading()
+        # kopia bazy i poczekaj na wątek zapisu (zmiany z TaskStore już w nim są)
+        self._request_backup()
+        self._animations.clear()
+        self._reminders.clear()
+        self._watchdog.stop()  # hook w instrument i after – nie zostają po zamkniętym oknie
+        self._saver.close()
+        if self._notifier is not None:
+            self._notifier.close()
+        if instrument.enabled():
+            instrument.dump()
+        db.close_connection()
         self.root.destroy()
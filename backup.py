@@ -0,0 +1,65 @@
+# backup.py
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import db
+from config import BACKUP_DIR, BACKUP_KEEP, PLIK, ensure_app_dir
+from instrument import timed
+
+# todo_plan-20250101-120000.db – nazwa sortuje się tak samo jak czas
+_PREFIX = "todo_plan-"
+_SUFFIX = ".db"
+
+
+def list_snapshots(backup_dir: Path = BACKUP_DIR) -> list[Path]:
+    """Kopie bazy od najstarszej do najnowszej."""
+    if not backup_dir.exists():
+        return []
+    return sorted(backup_dir.glob(f"{_PREFIX}*{_SUFFIX}"))
+
+
+@timed("backup.snapshot")
+def snapshot(keep: int = BACKUP_KEEP, backup_dir: Path = BACKUP_DIR) -> Path:
+    """
+    Kopia całej bazy przez sqlite3 online backup (spójna, nawet gdy baza jest
+    otwarta w WAL) do backup_dir. Zostawia tylko keep najnowszych kopii.
+    Wołać na wątku zapisu (WriteBehindSaver.call), żeby kopia zawierała
+    wszystkie wcześniejsze zmiany i nie blokowała interfejsu.
+    """
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = backup_dir / f"{_PREFIX}{stamp}{_SUFFIX}"
+    tmp = path.with_suffix(".tmp")
+
+    dest = sqlite3.connect(str(tmp))
+    try:
+        db.backup_to(dest)
+    finally:
+        dest.close()
+    os.replace(tmp, path)
+
+    for old in list_snapshots(backup_dir)[:-keep] if keep > 0 else ():
+        try:
+            old.unlink()
+        except OSError:
+            pass
+    return path
+
+
+@timed("backup.export_json")
+def export_json(path: str = PLIK) -> str:
+    """
+    Eksport na żądanie: zadania i serie w jednym, zwartym pliku JSON
+    (bez wcięć). Ten sam plik load() umie wczytać, gdy baza jest pusta.
+    """
+    data = {"tasks": db.load_all(), "series": db.load_series()}
+    ensure_app_dir()
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
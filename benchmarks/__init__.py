@@ -0,0 +1 @@
+# benchmarks – pomiary wydajności planera (uruchamianie: python -m benchmarks.run)
@@ -0,0 +1,96 @@
+# benchmarks/bench_store.py
+#
+# Benchmarki bez Tk: baza (db), daty (powtarzanie) i model (TaskStore).
+# Baza jest w MAJA_DATA_DIR – ustawia je benchmarks/run.py przed importem.
+
+import os
+from datetime import date
+
+import db
+from powtarzanie import REPEAT_OPTIONS, generate_repeats, metas_to_dates, parse_ddmm, series_dates
+from store import TaskStore
+
+from benchmarks.generate import make_planner
+from benchmarks.timing import measure
+
+
+def _reset_db():
+    """Pusta baza od zera (plik + WAL)."""
+    db.close_connection()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(db.DB_NAME + suffix)
+        except FileNotFoundError:
+            pass
+    db.init_db()
+
+
+def _fill_db(rows, series):
+    _reset_db()
+    db.write_batch(rows, [], series, [])
+
+
+def run(n: int, repeat: int = 3) -> dict:
+    rows, series = make_planner(n)
+    today = date.today()
+    results = {}
+
+    # ---------- baza ----------
+    results["db_write_batch_all"] = measure(lambda: db.write_batch(rows, []), repeat, setup=_reset_db)
+
+    _fill_db(rows, series)
+    changed = [dict(r, done=not r["done"]) for r in rows[: max(1, n // 100)]]
+    results["db_write_batch_1pct"] = measure(lambda: db.write_batch(changed, []), repeat)
+    results["db_load_all"] = measure(db.load_all, repeat)
+    results["db_load_series"] = measure(db.load_series, repeat)
+    results["db_purge_before"] = measure(
+        lambda: db.purge_before(today), repeat, setup=lambda: _fill_db(rows, series)
+    )
+
+    # ---------- daty ----------
+    metas = [r["meta"] for r in rows]
+
+    def parse_cold():
+        parse_ddmm.cache_clear()
+        metas_to_dates(metas)
+
+    results["dates_parse_cold"] = measure(parse_cold, repeat)
+    results["dates_parse_warm"] = measure(lambda: metas_to_dates(metas), repeat)
+
+    patterns = [p for p in REPEAT_OPTIONS if p != "Brak"]
+    k = max(1, n // 50)
+    results["repeats_generate"] = measure(
+        lambda: [generate_repeats(patterns[i % len(patterns)], today) for i in range(k)], repeat
+    )
+    results["repeats_series_dates"] = measure(
+        lambda: [series_dates(patterns[i % len(patterns)], today, today, today) for i in range(k)], repeat
+    )
+
+    # ---------- model ----------
+    # wiersze z bazy po purge (tak jak przy starcie aplikacji)
+    _fill_db(rows, series)
+    db.purge_before(today)
+    live_rows, live_series = db.load_all(), db.load_series()
+
+    store = TaskStore()
+    results["store_load"] = measure(lambda: store.load(live_rows, live_series), repeat)
+    results["store_query_all"] = measure(lambda: store.query("all"), repeat)
+    results["store_query_today"] = measure(lambda: store.query("today"), repeat)
+    results["store_query_tomorrow"] = measure(lambda: store.query("tomorrow"), repeat)
+
+    sample = store.items()[:: max(1, len(store) // 100)][:100]
+
+    def toggle_100():
+        for t in sample:
+            store.toggle(t, not t.is_done())
+
+    def star_100():
+        for t in sample:
+            store.star(t, not t.get_starred())
+
+    results["store_toggle_100"] = measure(toggle_100, repeat)
+    results["store_star_100"] = measure(star_100, repeat)
+    results["tasks_live"] = len(store)
+
+    db.close_connection()
+    return results
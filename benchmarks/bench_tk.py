@@ -0,0 +1,96 @@
+# benchmarks/bench_tk.py
+#
+# Benchmarki z Tk: start aplikacji (TodoApp + load), odświeżenie listy,
+# filtry i przewijanie. Potrzebny jest ekran X – bez monitora uruchom pod
+# wirtualnym serwerem, np.:
+#   xvfb-run -a python -m benchmarks.run --tk
+
+import tkinter as tk
+from datetime import date
+
+import db
+from app import TodoApp
+
+from benchmarks.bench_store import _fill_db
+from benchmarks.generate import make_planner
+from benchmarks.timing import measure
+
+
+def available() -> bool:
+    """Czy da się otworzyć okno Tk (jest DISPLAY / Xvfb)."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return False
+    root.destroy()
+    return True
+
+
+def _close(app, root):
+    app._watchdog.stop()
+    app._saver.close()
+    if app._notifier is not None:
+        app._notifier.close()
+    db.close_connection()
+    root.destroy()
+
+
+def _open_app():
+    """TodoApp po pierwszym narysowaniu i z wczytanymi WSZYSTKIMI zadaniami."""
+    root = tk.Tk()
+    app = TodoApp(root)
+    root.update()  # pierwsze narysowanie
+    app._startup_load()     # gdyby <Expose> jeszcze nie przyszło (bez efektu, jeśli już było)
+    app._finish_loading()   # reszta wierszy, które normalnie dochodzą kawałkami
+    root.update_idletasks()
+    return app, root
+
+
+def run(n: int, repeat: int = 3) -> dict:
+    rows, series = make_planner(n)
+    results = {}
+
+    def start_app():
+        _fill_db(rows, series)
+        db.close_connection()
+        app, root = _open_app()
+        _close(app, root)
+
+    results["app_start"] = measure(start_app, repeat)
+
+    # jedna instancja na pozostałe pomiary
+    _fill_db(rows, series)
+    app, root = _open_app()
+    try:
+        def refresh():
+            app._refresh_view()
+            root.update_idletasks()
+
+        results["refresh_view"] = measure(refresh, repeat)
+
+        def filters():
+            for mode in ("today", "tomorrow", "all"):
+                app.apply_filter(mode)
+                root.update_idletasks()
+
+        results["apply_filter_cycle"] = measure(filters, repeat)
+
+        def scroll():
+            for step in range(20):
+                app.canvas.yview_moveto(step / 20)
+                app.task_list.render()
+                root.update_idletasks()
+
+        results["scroll_20_steps"] = measure(scroll, repeat)
+
+        today_tasks = app.store.on(date.today())[:50]
+
+        def toggle():
+            for t in today_tasks:
+                app.on_task_change(t, not t.is_done())
+            root.update_idletasks()
+
+        results["toggle_today_50"] = measure(toggle, repeat)
+    finally:
+        _close(app, root)
+    return results
@@ -0,0 +1,70 @@
+# benchmarks/generate.py
+
+import random
+from datetime import date, timedelta
+
+from config import CATEGORIES
+from powtarzanie import REPEAT_OPTIONS, fmt_ddmm
+
+WORDS = (
+    "posprzątaj", "pokój", "odrób", "matmę", "zakupy", "trening", "czytanie",
+    "angielski", "kino", "lekarz", "prezent", "pranie", "rower", "projekt",
+)
+
+
+def make_rows(n: int, seed: int = 0, today: date | None = None) -> list[dict]:
+    """
+    n syntetycznych zadań w formacie db.load_all():
+    mieszane kategorie, ~10% z gwiazdką, ~20% zrobionych, ~10% z godziną,
+    daty od 30 dni wstecz do 30 dni naprzód (co piąte bez daty).
+    """
+    rnd = random.Random(seed)
+    today = today or date.today()
+    rows = []
+    for i in range(n):
+        d = None if rnd.random() < 0.2 else today + timedelta(days=rnd.randint(-30, 30))
+        rows.append({
+            "id": i + 1,
+            "text": " ".join(rnd.choices(WORDS, k=rnd.randint(1, 5))),
+            "done": rnd.random() < 0.2,
+            "cat": rnd.choice(CATEGORIES),
+            "meta": fmt_ddmm(d) if d else None,
+            "star": rnd.random() < 0.1,
+            "created_seq": i,
+            "rep": False,
+            "time": f"{rnd.randint(6, 22):02d}:{rnd.choice((0, 15, 30, 45)):02d}" if rnd.random() < 0.1 else None,
+            "due_date": d.isoformat() if d else None,
+        })
+    return rows
+
+
+def make_series(n: int, seed: int = 0, today: date | None = None, first_seq: int = 0) -> list[dict]:
+    """n serii powtórzeń w formacie db.load_series() (wszystkie wzorce poza "Brak")."""
+    rnd = random.Random(seed)
+    today = today or date.today()
+    patterns = [p for p in REPEAT_OPTIONS if p != "Brak"]
+    series = []
+    for i in range(n):
+        start = today - timedelta(days=rnd.randint(0, 60))
+        done = [
+            (today + timedelta(days=k)).isoformat()
+            for k in range(3) if rnd.random() < 0.3
+        ]
+        series.append({
+            "id": i + 1,
+            "text": " ".join(rnd.choices(WORDS, k=rnd.randint(1, 4))),
+            "cat": rnd.choice(CATEGORIES),
+            "pattern": rnd.choice(patterns),
+            "start": start.isoformat(),
+            "exceptions": [],
+            "done": done,
+            "star": [],
+            "created_seq": first_seq + i,
+            "time": None,
+        })
+    return series
+
+
+def make_planner(n: int, seed: int = 0) -> tuple[list[dict], list[dict]]:
+    """Cały planer: n zadań + n // 50 serii (jak u kogoś, kto dużo planuje)."""
+    return make_rows(n, seed), make_series(max(1, n // 50), seed, first_seq=n)
@@ -0,0 +1,95 @@
+# benchmarks/run.py
+#
+# Uruchamianie (z katalogu projektu):
+#   python -m benchmarks.run                      # bez Tk, 1k / 10k / 100k zadań
+#   python -m benchmarks.run --sizes 1000 10000
+#   xvfb-run -a python -m benchmarks.run --tk     # także pomiary z oknem Tk
+#   xvfb-run -a python -m benchmarks.run --tk --render canvas   # lista rysowana na Canvasie
+#
+# Wyniki idą do benchmarks/results/<data>-<commit>.json, żeby dało się
+# porównać dwa commity (np. diffem albo jq).
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarki Planera Maji")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tk", action="store_true", help="także benchmarki z Tk (wymaga ekranu / Xvfb)")
+    parser.add_argument("--render", choices=("widgets", "canvas"), default="widgets",
+                        help="wiersze listy w benchmarkach Tk (MAJA_RENDER)")
+    parser.add_argument("--out", type=Path, help="plik wyników (domyślnie benchmarks/results/...)")
+    args = parser.parse_args(argv)
+
+    # baza i pliki w katalogu tymczasowym – NIE w prawdziwym folderze użytkownika;
+    # musi być ustawione przed importem config / db
+    data_dir = tempfile.mkdtemp(prefix="maja-bench-")
+    os.environ["MAJA_DATA_DIR"] = data_dir
+    os.environ["MAJA_NOTIFY"] = "null"
+    os.environ["MAJA_RENDER"] = args.render
+    sys.path.insert(0, str(ROOT))
+
+    from benchmarks import bench_store
+
+    report = {
+        "commit": _commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "render": args.render,
+        "results": {},
+    }
+
+    tk_ok = False
+    if args.tk:
+        from benchmarks import bench_tk
+        tk_ok = bench_tk.available()
+        if not tk_ok:
+            print("Tk: brak ekranu – pomijam (uruchom pod xvfb-run)", file=sys.stderr)
+
+    for n in args.sizes:
+        print(f"== {n} zadań", file=sys.stderr)
+        size_results = {"store": bench_store.run(n, args.repeat)}
+        if tk_ok:
+            size_results["tk"] = bench_tk.run(n, args.repeat)
+        report["results"][str(n)] = size_results
+        for group, values in size_results.items():
+            for name, value in values.items():
+                shown = f"{value['best'] * 1000:10.2f} ms" if isinstance(value, dict) else f"{value:>10}"
+                print(f"  {group}.{name:<24} {shown}", file=sys.stderr)
+
+    out = args.out
+    if out is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        out = RESULTS_DIR / f"{stamp}-{report['commit']}.json"
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# benchmarks/timing.py
+
+import time
+
+
+def measure(fn, repeat: int = 3, setup=None) -> dict:
+    """
+    Woła fn() repeat razy (przed każdym razem setup(), jeśli podane – poza pomiarem)
+    i zwraca czasy w sekundach: {"best", "mean", "runs"}.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "mean": sum(times) / len(times), "runs": len(times)}
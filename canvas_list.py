@@ -0,0 +1,224 @@
+# canvas_list.py
+
+import tkinter.font as tkfont
+
+import fonts
+from config import category_color
+from task_list import ROW_GAP, ROW_PADX, TaskListBase
+from task_row import STAR_OFF, STAR_ON
+
+CHECK = "✓"
+DELETE_TEXT = "Usuń"
+# odstęp między elementami w wierszu i wewnętrzny margines wiersza
+GAP = 8
+PAD = 10
+
+
+class CanvasTaskList(TaskListBase):
+    """
+    Lekka lista zadań (MAJA_RENDER=canvas): wiersz to kilka elementów
+    narysowanych na Canvasie (tło, kratka, tekst, ⭐, badge, Usuń, data)
+    zamiast ~10 widgetów TaskRow z własnymi bindami.
+
+    Przewijanie i widoczny zakres jak w VirtualTaskList (TaskListBase);
+    slot to tu słownik id elementów canvasa. Kliknięcia rozpoznajemy po
+    tagach elementów: "chk" (odhaczenie), "star" (gwiazdka), "del" (Usuń)
+    + "slot<nr>".
+    """
+
+    def __init__(self, canvas, scrollbar, c, s, on_change, on_star_toggle, on_delete, wheel_handler=None,
+                 animator=None):
+        super().__init__(canvas, scrollbar, c, s)
+        self.on_change = on_change
+        self.on_star_toggle = on_star_toggle
+        self.on_delete = on_delete
+        # self._slots: [słownik id elementów, co narysowano albo None]
+        self._half_h = 0
+        self._box = 0
+        self._widths = {}        # (font, tekst) -> szerokość w px
+
+        # wheel_handler niepotrzebny: elementy leżą na samym canvasie, a ten ma już kółko myszy;
+        # animator – dla zgodności z VirtualTaskList (lekkie wiersze nie mają animacji)
+        for tag, handler in (("chk", self._on_check), ("star", self._on_star), ("del", self._on_delete)):
+            canvas.tag_bind(tag, "<Button-1>", handler)
+            canvas.tag_bind(tag, "<Enter>", self._on_enter)
+            canvas.tag_bind(tag, "<Leave>", self._on_leave)
+
+    def set_sizes(self, s):
+        """Zmiana zoomu: fonty zmieniły się same (fonts.py), mierzymy i rysujemy od nowa."""
+        self._widths.clear()
+        super().set_sizes(s)
+
+    def _on_theme(self):
+        """Nowy motyw: stałe kolory slotów od nowa, reszta przy ponownym rysowaniu."""
+        for ids, _shown in self._slots:
+            self._color_slot(ids)
+        super()._on_theme()
+
+    # ---------- sloty ----------
+    def _add_slot(self):
+        cv = self.canvas
+        tags = (f"slot{len(self._slots)}",)
+        ids = {
+            "bg": cv.create_rectangle(0, 0, 0, 0, width=2, tags=tags),
+            "chk": cv.create_rectangle(0, 0, 0, 0, tags=tags + ("chk",)),
+            "mark": cv.create_text(0, 0, text="", font=fonts.get("button"), tags=tags + ("chk",)),
+            "text": cv.create_text(0, 0, anchor="w", font=fonts.get("task"), tags=tags),
+            "star": cv.create_text(0, 0, font=fonts.get("star"), tags=tags + ("star",)),
+            "badge": cv.create_rectangle(0, 0, 0, 0, width=2, tags=tags),
+            "badge_text": cv.create_text(0, 0, font=fonts.get("button"), tags=tags),
+            "del": cv.create_rectangle(0, 0, 0, 0, outline="", tags=tags + ("del",)),
+            "del_text": cv.create_text(0, 0, text=DELETE_TEXT, font="TkDefaultFont", tags=tags + ("del",)),
+            "date": cv.create_text(0, 0, anchor="e", font=fonts.get("date"), tags=tags),
+        }
+        self._color_slot(ids)
+        cv.itemconfigure(tags[0], state="hidden")
+        self._slots.append([ids, None])
+
+    def _show_slot(self, i, idx):
+        slot = self._slots[i]
+        task = self.items[idx]
+        shown = (
+            task, idx, self._width, task.get_text(), task.get_cat(),
+            task.get_starred(), task.get_meta(), task.get_time(), task.is_done(),
+        )
+        if shown != slot[1]:
+            if slot[1] is None:
+                self.canvas.itemconfigure(f"slot{i}", state="normal")
+            self._draw(slot[0], task, idx)  # sam chowa datę, jeśli jej brak
+            slot[1] = shown
+
+    def _hide_slot(self, i):
+        self.canvas.itemconfigure(f"slot{i}", state="hidden")
+        self._slots[i][1] = None
+
+    def _measure_row(self, _sample=None):
+        """Wysokość wiersza z metryk fontów: wyższy z tekstu zadania i badge'a + marginesy."""
+        text_h = fonts.get("task").metrics("linespace")
+        badge_h = fonts.get("button").metrics("linespace") + GAP
+        self._half_h = badge_h // 2                       # pół wysokości badge'a / Usuń
+        self._box = fonts.get("task").metrics("ascent")  # bok kratki
+        self._row_h = max(text_h, badge_h) + 2 * GAP + ROW_GAP
+
+    # ---------- rysowanie ----------
+    def _text_width(self, font, text):
+        key = (str(font), text)
+        width = self._widths.get(key)
+        if width is None:
+            width = self._widths[key] = font.measure(text)
+        return width
+
+    def _color_slot(self, ids):
+        """Kolory slotu, które nie zależą od zadania (z palety bieżącego motywu)."""
+        cv = self.canvas
+        c = self.c
+        cv.itemconfigure(ids["bg"], outline=c["BORDER"])
+        cv.itemconfigure(ids["chk"], outline=c["TEXT"], fill=c["ENTRY_BG"])
+        cv.itemconfigure(ids["mark"], fill=c["TEXT"])
+        cv.itemconfigure(ids["del"], fill=c["CARD_2"])
+        cv.itemconfigure(ids["del_text"], fill=c["TEXT"])
+        cv.itemconfigure(ids["date"], fill=c["MUTED"])
+
+    def _draw(self, ids, task, idx):
+        """Ustawia elementy jednego slotu: pozycje liczone od prawej (data, Usuń, badge, ⭐), tekst zostaje."""
+        cv = self.canvas
+        c = self.c
+        done = task.is_done()
+        y0 = idx * self._row_h + ROW_GAP // 2
+        y1 = y0 + self._row_h - ROW_GAP
+        ym = (y0 + y1) // 2
+        x0 = ROW_PADX
+        x = max(self._width - ROW_PADX, x0 + 1)
+
+        cv.coords(ids["bg"], x0, y0, x, y1)
+        cv.itemconfigure(ids["bg"], fill=c["CARD"] if idx % 2 else c["CARD_2"])
+
+        # data (+ godzina)
+        x -= PAD
+        meta = task.get_meta()
+        if meta:
+            time = task.get_time()
+            text = f"{meta} {time}" if time else meta
+            cv.coords(ids["date"], x, ym)
+            cv.itemconfigure(ids["date"], text=text, state="normal")
+            x -= self._text_width(fonts.get("date"), text) + GAP
+        else:
+            cv.itemconfigure(ids["date"], state="hidden")
+
+        # Usuń
+        half_h = self._half_h
+        w = self._text_width(tkfont.nametofont("TkDefaultFont"), DELETE_TEXT) + 2 * PAD
+        cv.coords(ids["del"], x - w, ym - half_h, x, ym + half_h)
+        cv.coords(ids["del_text"], x - w // 2, ym)
+        x -= w + GAP
+
+        # badge kategorii
+        cat = task.get_cat()
+        w = self._text_width(fonts.get("button"), cat) + 3 * PAD
+        cv.coords(ids["badge"], x - w, ym - half_h, x, ym + half_h)
+        cv.itemconfigure(ids["badge"], fill="#151515" if done else "#0E0E10", outline=category_color(cat))
+        cv.coords(ids["badge_text"], x - w // 2, ym)
+        cv.itemconfigure(ids["badge_text"], text=cat, fill="#D0D0D0" if done else "white")
+        x -= w + GAP
+
+        # ⭐
+        starred = task.get_starred()
+        w = self._text_width(fonts.get("star"), STAR_ON) + GAP
+        cv.coords(ids["star"], x - w // 2, ym)
+        cv.itemconfigure(
+            ids["star"], text=STAR_ON if starred else STAR_OFF, fill="#FFD54F" if starred else "#A0A0A0"
+        )
+        x -= w + GAP
+
+        # kratka + tekst (przycięty, żeby nie wchodził na prawą część)
+        box = self._box
+        left = x0 + PAD
+        cv.coords(ids["chk"], left, ym - box // 2, left + box, ym + box // 2)
+        cv.coords(ids["mark"], left + box // 2, ym)
+        cv.itemconfigure(ids["mark"], text=CHECK if done else "")
+        left += box + GAP
+        font = fonts.get("task_done" if done else "task")
+        cv.coords(ids["text"], left, ym)
+        cv.itemconfigure(
+            ids["text"], text=fonts.fit(task.get_text(), font, x - left),
+            font=font, fill=c["MUTED"] if done else c["TEXT"],
+        )
+
+    # ---------- kliknięcia (po tagach) ----------
+    def _current(self):
+        """(slot, zadanie) pod kursorem albo (None, None)."""
+        found = self.canvas.find_withtag("current")
+        if not found:
+            return None, None
+        for tag in self.canvas.gettags(found[0]):
+            if tag.startswith("slot"):
+                slot = self._slots[int(tag[4:])]
+                if slot[1] is not None:
+                    return slot, slot[1][0]
+        return None, None
+
+    def _on_check(self, _e=None):
+        _slot, task = self._current()
+        if task is not None and self.on_change:
+            self.on_change(task, not task.is_done())
+
+    def _on_star(self, _e=None):
+        _slot, task = self._current()
+        if task is not None and self.on_star_toggle:
+            self.on_star_toggle(task, not task.get_starred())
+
+    def _on_delete(self, _e=None):
+        _slot, task = self._current()
+        if task is not None and self.on_delete:
+            self.on_delete(task)
+
+    def _on_enter(self, _e=None):
+        self.canvas.configure(cursor="hand2")
+        slot, _task = self._current()
+        if slot is not None and "del" in self.canvas.gettags("current"):
+            self.canvas.itemconfigure(slot[0]["del"], fill=self.c["CARD"])
+
+    def _on_leave(self, _e=None):
+        self.canvas.configure(cursor="")
+        for ids, _shown in self._slots:
+            self.canvas.itemconfigure(ids["del"], fill=self.c["CARD_2"])
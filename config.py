@@ -1,15 +1,48 @@
 # config.py
 
+import os
 from pathlib import Path
-import tkinter as tk
-import tkinter.ttk as ttk
 
-# Folder i plik zapisu
-APP_DIR = Path.home() / "MajaPlanner"
-APP_DIR.mkdir(parents=True, exist_ok=True)
+# Folder i plik zapisu (MAJA_DATA_DIR – inny folder, np. dla benchmarków)
+APP_DIR = Path(os.environ.get("MAJA_DATA_DIR") or Path.home() / "MajaPlanner")
 PLIK = str(APP_DIR / "todo_plan.json")
 
-# Motyw (jasne fiolety + ciemne elementy)
+
+def ensure_app_dir():
+    """Tworzy APP_DIR dopiero wtedy, gdy coś ma tam trafić (nie przy imporcie)."""
+    APP_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# Zapis w tle: zmiany z kilku kliknięć w tym oknie (ms) idą do bazy jednym commitem
+SAVE_DEBOUNCE_MS = 300
+# ...a nieudany zapis ponawiamy najpóźniej po tylu ms (albo wcześniej, z kolejną zmianą)
+SAVE_RETRY_MS = 5000
+# co ile ms okno sprawdza, czy zapis w tle się udaje (napis przy liście zadań)
+SAVE_STATUS_MS = 1000
+
+# Start: zadania wczytujemy po pierwszym narysowaniu okna, najpóźniej po tylu ms
+STARTUP_FALLBACK_MS = 500
+# Duże plany wczytujemy kawałkami: po LOAD_CHUNK wierszy, najwyżej LOAD_SLICE_MS naraz
+LOAD_CHUNK = 500
+LOAD_SLICE_MS = 15
+
+# Animacje (animations.py): klatki na sekundę i najwięcej efektów naraz
+ANIM_FPS = 25
+ANIM_MAX_ACTIVE = 8
+
+# Lista zadań: "widgets" – wiersz to widgety TaskRow (domyślnie),
+# "canvas" – lżejsze wiersze rysowane na Canvasie (MAJA_RENDER=canvas)
+RENDER_MODE = os.environ.get("MAJA_RENDER", "widgets")
+
+# Kopie zapasowe bazy (backup.py): co ile ms, ile ostatnich kopii trzymać i gdzie
+BACKUP_INTERVAL_MS = 30 * 60 * 1000
+BACKUP_KEEP = 5
+BACKUP_DIR = APP_DIR / "backups"
+
+# Serie powtórzeń: wystąpienia rozwijamy tylko na tyle dni do przodu (licząc z dzisiaj)
+SERIES_WINDOW_DAYS = 7
+
+# Motywy: nazwa -> paleta (te same klucze w każdym); przełączanie w miejscu – styles.py
 THEMES = {
     "Fioletowy": {
         "BG": "#EFE6FF",
@@ -24,8 +57,22 @@ THEMES = {
         "BORDER": "#B59CFF",
         "ENTRY_BG": "white",
     },
+    # ciemny: te same fiolety, tylko przygaszone tła i jasny tekst
+    "Nocny": {
+        "BG": "#1E1A2B",
+        "RIBBON": "#4B2F9E",
+        "RIBBON_DARK": "#3A2380",
+        "CARD": "#2B2540",
+        "CARD_2": "#342D4D",
+        "ACCENT": "#8A55F0",
+        "ACCENT_HOVER": "#9E70FF",
+        "TEXT": "#ECE6FF",
+        "MUTED": "#A89CCB",
+        "BORDER": "#4E4378",
+        "ENTRY_BG": "#3B3357",
+    },
 }
-PALETA = THEMES["Fioletowy"]
+DEFAULT_THEME = "Fioletowy"
 
 # Kategorie (zgodnie z Twoją listą)
 CATEGORIES = [
@@ -53,20 +100,9 @@ CATEGORY_COLORS = {
 def category_color(name: str) -> str:
     return CATEGORY_COLORS.get(name, CATEGORY_COLORS["Inne"])
 
-def style_button(btn, c, primary=True, fsize=10):
-    if primary:
-        bg, abg, fg = c["ACCENT"], c["ACCENT_HOVER"], "white"
-    else:
-        bg, abg, fg = c["CARD"], c["CARD_2"], c["TEXT"]
-    btn.configure(
-        bg=bg, fg=fg, activebackground=abg, activeforeground=fg,
-        relief="flat", bd=0, padx=14, pady=8, cursor="hand2",
-        font=("Segoe UI", fsize, "bold")
-    )
-    btn.bind("<Enter>", lambda _e: btn.configure(bg=abg))
-    btn.bind("<Leave>", lambda _e: btn.configure(bg=bg))
-
 def sizes(zoomed: bool):
+    # wrap – px na tekst zadania, zanim wiersz pozna swoją szerokość (potem tekst
+    # przycinany z "…" idzie za szerokością wiersza – TaskRow._fit_text)
     if zoomed:
         return dict(title=20, subtitle=12, button=12, entry=13, task=14, wrap=520)
     else:
@@ -1,22 +1,107 @@
+import json
 import sqlite3
-from config import APP_DIR  # używamy tego samego folderu co JSON
+import threading
+from datetime import date
+from config import APP_DIR, ensure_app_dir  # używamy tego samego folderu co JSON
+from powtarzanie import meta_to_ddmm_date
+from instrument import timed
 
 # Baza będzie w pliku "todo_plan.db" w katalogu MajaPlanner
 DB_PATH = APP_DIR / "todo_plan.db"
 DB_NAME = str(DB_PATH)
 
+# Jedno długo żyjące połączenie NA WĄTEK (wątek Tk + wątek zapisu w tle).
+# sqlite3 nie pozwala używać połączenia z innego wątku, więc trzymamy je w threading.local.
+_local = threading.local()
+
+# Ustawienia połączenia:
+#   WAL          – zapis nie blokuje odczytu, commit bez przepisywania całego journala,
+#   NORMAL       – przy WAL fsync tylko przy checkpoincie (bezpieczne przy awarii aplikacji),
+#   cache_size   – ujemna wartość = rozmiar w KiB (tu ~8 MB),
+#   temp_store   – tymczasowe tabele/indeksy w pamięci.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA temp_store=MEMORY",
+)
+# ile skompilowanych zapytań sqlite3 trzyma w cache na połączenie
+_STATEMENT_CACHE = 64
+
+# Zapytania jako stałe – ten sam tekst SQL = ten sam przygotowany statement z cache
+_INSERT_SQL = """
+    INSERT INTO tasks (text, done, cat, meta, star, created_seq, rep, time, due_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_WITH_ID_SQL = """
+    INSERT INTO tasks (id, text, done, cat, meta, star, created_seq, rep, time, due_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_UPSERT_SQL = _INSERT_WITH_ID_SQL + """
+    ON CONFLICT(id) DO UPDATE SET
+        text = excluded.text, done = excluded.done, cat = excluded.cat,
+        meta = excluded.meta, star = excluded.star,
+        created_seq = excluded.created_seq, rep = excluded.rep, time = excluded.time,
+        due_date = excluded.due_date
+"""
+_DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+# kolumny, po których wolno usuwać hurtem (delete_where) – nazwy idą wprost do SQL-a
+_WHERE_COLUMNS = ("done", "star", "cat", "due_date")
+_PURGE_BEFORE_SQL = "DELETE FROM tasks WHERE due_date < ?"
+
+_UPSERT_SERIES_SQL = """
+    INSERT INTO series (id, text, cat, pattern, start, exceptions, done_dates, star_dates, created_seq, time)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        text = excluded.text, cat = excluded.cat, pattern = excluded.pattern,
+        start = excluded.start, exceptions = excluded.exceptions,
+        done_dates = excluded.done_dates, star_dates = excluded.star_dates,
+        created_seq = excluded.created_seq, time = excluded.time
+"""
+_DELETE_SERIES_SQL = "DELETE FROM series WHERE id = ?"
+
 
 def _get_connection():
-    """Łączy się z bazą SQLite i ustawia row_factory, żeby zwracać słowniki."""
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+    """
+    Zwraca połączenie bieżącego wątku (otwierane tylko raz) z row_factory,
+    żeby zwracać słowniki, i dostrojonymi PRAGMA.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        ensure_app_dir()
+        conn = sqlite3.connect(DB_NAME, cached_statements=_STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
     return conn
 
 
-def init_db():
+def close_connection():
+    """Zamyka połączenie bieżącego wątku (np. przy wyjściu z aplikacji)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        _local.conn = None
+        conn.close()
+
+
+# ================== Migracje schematu ==================
+# Wersja schematu siedzi w samej bazie (PRAGMA user_version).
+# Migracja N podnosi bazę z wersji N-1 do N; nowe zmiany schematu = nowa
+# funkcja NA KOŃCU _MIGRATIONS (istniejących nie zmieniamy).
+# Bazy sprzed migracji mają user_version = 0, a ich tabele mogą już mieć
+# część kolumn – dlatego migracje sprawdzają, co już jest (_add_column).
+
+def _add_column(conn, table, name, decl):
+    """ALTER TABLE ... ADD COLUMN, jeśli kolumny jeszcze nie ma."""
+    have = {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}
+    if name not in have:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+def _migrate_1_base(conn):
     """
-    Tworzy bazę danych i tabelę tasks, jeśli jeszcze ich nie ma.
-    Kolumny:
+    Tabela tasks:
       - id          – techniczne ID
       - text        – treść zadania
       - done        – 0/1 czy zrobione
@@ -26,9 +111,7 @@ def init_db():
       - created_seq – kolejność tworzenia
       - rep         – 0/1 czy to zadanie z auto-powtarzania
     """
-    conn = _get_connection()
-    cur = conn.cursor()
-    cur.execute(
+    conn.execute(
         """
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -42,82 +125,251 @@ def init_db():
         )
         """
     )
-    conn.commit()
-    conn.close()
 
 
-def save_all(tasks_data):
+def _migrate_2_series(conn):
     """
-    Zapisuje CAŁĄ listę zadań do bazy.
-    Najpierw czyści tabelę, potem wstawia wszystko od nowa.
-    tasks_data to lista słowników jak w app.save():
-      {
-        "text": ...,
-        "done": True/False,
-        "cat": ...,
-        "meta": ...,
-        "star": True/False,
-        "created_seq": int,
-        "rep": True/False,
-      }
+    Tabela series – zadania powtarzalne zapisane RAZ jako reguła:
+      - pattern     – np. "Codziennie" (jak w powtarzanie.REPEAT_OPTIONS)
+      - start       – data pierwszego wystąpienia (ISO "rrrr-mm-dd")
+      - exceptions  – JSON: daty usuniętych wystąpień
+      - done_dates  – JSON: daty wystąpień odhaczonych jako zrobione
+      - star_dates  – JSON: daty wystąpień przypiętych gwiazdką
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS series (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            text TEXT NOT NULL,
+            cat TEXT,
+            pattern TEXT NOT NULL,
+            start TEXT NOT NULL,
+            exceptions TEXT NOT NULL DEFAULT '[]',
+            done_dates TEXT NOT NULL DEFAULT '[]',
+            star_dates TEXT NOT NULL DEFAULT '[]',
+            created_seq INTEGER
+        )
+        """
+    )
+
+
+def _migrate_3_time(conn):
+    """Kolumna time (tasks i series) – godzina przypomnienia "gg:mm" albo NULL."""
+    _add_column(conn, "tasks", "time", "TEXT")
+    _add_column(conn, "series", "time", "TEXT")
+
+
+def _migrate_4_due_date(conn):
+    """
+    Kolumna due_date – data zadania jako ISO "rrrr-mm-dd" (sortuje się jak data),
+    wyliczona z meta "dd.mm" (bieżący rok, jak w aplikacji), plus indeksy
+    pod zapytania po dacie / zrobionych i pod kolejność wyświetlania.
+    """
+    _add_column(conn, "tasks", "due_date", "TEXT")
+    year = date.today().year
+    rows = conn.execute("SELECT id, meta FROM tasks WHERE meta IS NOT NULL").fetchall()
+    conn.executemany(
+        "UPDATE tasks SET due_date = ? WHERE id = ?",
+        [(_iso(meta_to_ddmm_date(r["meta"], year)), r["id"]) for r in rows],
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_done ON tasks (due_date, done)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_star_seq ON tasks (star, created_seq)")
+
+
+_MIGRATIONS = (
+    _migrate_1_base,
+    _migrate_2_series,
+    _migrate_3_time,
+    _migrate_4_due_date,
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def init_db():
+    """
+    Tworzy bazę danych albo podnosi jej schemat do SCHEMA_VERSION:
+    wykonuje brakujące migracje (każda we własnej transakcji razem
+    z nowym PRAGMA user_version).
+    Zwraca True, jeśli baza była zupełnie nowa (tabele utworzone teraz).
     """
     conn = _get_connection()
-    cur = conn.cursor()
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    fresh = version == 0 and conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks'"
+    ).fetchone() is None
 
-    # Czyścimy tabelę
-    cur.execute("DELETE FROM tasks")
+    for number, migrate in enumerate(_MIGRATIONS[version:], start=version + 1):
+        # sqlite3 sam nie zaczyna transakcji przed CREATE / ALTER TABLE (tylko
+        # przed INSERT/UPDATE/DELETE) – bez BEGIN każde DDL commitowałoby się
+        # osobno, a awaria przed user_version zostawiłaby nowy schemat ze starą wersją
+        with conn:
+            conn.execute("BEGIN")
+            migrate(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+    return fresh
 
-    # Wstawiamy od nowa
-    for item in tasks_data:
-        cur.execute(
-            """
-            INSERT INTO tasks (text, done, cat, meta, star, created_seq, rep)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                item.get("text", ""),
-                1 if item.get("done") else 0,
-                item.get("cat"),
-                item.get("meta"),
-                1 if item.get("star") else 0,
-                item.get("created_seq"),
-                1 if item.get("rep") else 0,
-            ),
+
+def _iso(d):
+    return d.isoformat() if d is not None else None
+
+
+def _task_params(item):
+    """
+    Zamienia słownik zadania na krotkę wartości kolumn (bez id).
+    due_date bierzemy z item["due_date"], a bez niego liczymy z meta.
+    """
+    due_date = item["due_date"] if "due_date" in item else _iso(meta_to_ddmm_date(item.get("meta")))
+    return (
+        item.get("text", ""),
+        1 if item.get("done") else 0,
+        item.get("cat"),
+        item.get("meta"),
+        1 if item.get("star") else 0,
+        item.get("created_seq"),
+        1 if item.get("rep") else 0,
+        item.get("time"),
+        due_date,
+    )
+
+
+def _series_params(item):
+    """Słownik serii -> wartości kolumn tabeli series (listy dat jako JSON)."""
+    return (
+        item["id"],
+        item.get("text", ""),
+        item.get("cat"),
+        item["pattern"],
+        item["start"],
+        json.dumps(sorted(item.get("exceptions", ()))),
+        json.dumps(sorted(item.get("done", ()))),
+        json.dumps(sorted(item.get("star", ()))),
+        item.get("created_seq"),
+        item.get("time"),
+    )
+
+
+@timed("db.write_batch")
+def write_batch(upserts, deleted_ids, series_upserts=(), deleted_series_ids=()):
+    """
+    Zapisuje paczkę zmian w JEDNEJ transakcji (jeden commit):
+      - upserts: lista słowników zadań (format jak TaskStore.row_data():
+        id, text, done, cat, meta, star, created_seq, rep, time, due_date –
+        bez due_date liczone z meta); bez "id" -> INSERT z nowym id,
+        z "id" -> INSERT albo UPDATE, jeśli wiersz o tym id już jest
+        (aplikacja może sama nadawać id – patrz max_task_id()),
+      - deleted_ids: lista id do usunięcia,
+      - series_upserts / deleted_series_ids: to samo dla tabeli series
+        (format jak w load_series(); id zawsze nadaje aplikacja).
+    Zwraca listę id dla upserts (w tej samej kolejności).
+    """
+    conn = _get_connection()
+    ids = []
+    with conn:
+        known = []
+        for item in upserts:
+            task_id = item.get("id")
+            if task_id is None:
+                task_id = conn.execute(_INSERT_SQL, _task_params(item)).lastrowid
+            else:
+                known.append((task_id,) + _task_params(item))
+            ids.append(task_id)
+        conn.executemany(_UPSERT_SQL, known)
+        conn.executemany(
+            _DELETE_SQL,
+            [(task_id,) for task_id in deleted_ids if task_id is not None],
         )
+        conn.executemany(_UPSERT_SERIES_SQL, [_series_params(item) for item in series_upserts])
+        conn.executemany(_DELETE_SERIES_SQL, [(series_id,) for series_id in deleted_series_ids])
+    return ids
+
+
+@timed("db.purge_before")
+def purge_before(day):
+    """
+    Usuwa zadania z datą (due_date) wcześniejszą niż day – jeden DELETE
+    po indeksie (due_date, done), w jednej transakcji. Zadania bez daty zostają.
+    Zwraca liczbę usuniętych wierszy.
+    """
+    conn = _get_connection()
+    with conn:
+        cur = conn.execute(_PURGE_BEFORE_SQL, (day.isoformat(),))
+    return cur.rowcount
+
+
+@timed("db.delete_where")
+def delete_where(**conditions):
+    """
+    Usuwa JEDNYM poleceniem DELETE zadania spełniające wszystkie warunki
+    kolumna=wartość, np. delete_where(done=1). Dozwolone kolumny: _WHERE_COLUMNS.
+    Zwraca liczbę usuniętych wierszy.
+    """
+    if not conditions:
+        raise ValueError("delete_where() bez warunków – do czyszczenia jest delete_all()")
+    for column in conditions:
+        if column not in _WHERE_COLUMNS:
+            raise ValueError(f"delete_where(): nieznana kolumna {column!r}")
+    sql = "DELETE FROM tasks WHERE " + " AND ".join(f"{column} = ?" for column in conditions)
+    conn = _get_connection()
+    with conn:
+        cur = conn.execute(sql, tuple(conditions.values()))
+    return cur.rowcount
+
+
+@timed("db.delete_all")
+def delete_all():
+    """Usuwa wszystkie zadania i serie (jedna transakcja). Zwraca liczbę usuniętych zadań."""
+    conn = _get_connection()
+    with conn:
+        cur = conn.execute("DELETE FROM tasks")
+        conn.execute("DELETE FROM series")
+    return cur.rowcount
+
 
-    conn.commit()
-    conn.close()
+def max_task_id():
+    """Największe id w tabeli tasks (0, jeśli pusta). Od niego aplikacja nadaje nowe id."""
+    conn = _get_connection()
+    (max_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()
+    return max_id
+
+
+def max_series_id():
+    """Największe id w tabeli series (0, jeśli pusta)."""
+    conn = _get_connection()
+    (max_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM series").fetchone()
+    return max_id
+
+
+def backup_to(dest):
+    """Kopiuje całą bazę do otwartego połączenia dest (sqlite3 online backup)."""
+    _get_connection().backup(dest)
 
 
+@timed("db.load_all")
 def load_all():
     """
     Wczytuje wszystkie zadania z bazy i zwraca listę słowników
-    w TAKIM SAMYM formacie jak wcześniej z JSON-a.
+    w TAKIM SAMYM formacie jak wcześniej z JSON-a (plus klucz "id").
     Jeśli tabela jeszcze nie istnieje lub jest pusta -> zwraca [].
     """
     conn = _get_connection()
-    cur = conn.cursor()
 
     try:
-        cur.execute(
+        rows = conn.execute(
             """
-            SELECT text, done, cat, meta, star, created_seq, rep
+            SELECT id, text, done, cat, meta, star, created_seq, rep, time, due_date
             FROM tasks
             ORDER BY created_seq ASC, id ASC
             """
-        )
+        ).fetchall()
     except sqlite3.OperationalError:
         # tabela jeszcze nie istnieje
-        conn.close()
         return []
 
-    rows = cur.fetchall()
-    conn.close()
-
     result = []
     for r in rows:
         result.append(
             {
+                "id": r["id"],
                 "text": r["text"],
                 "done": bool(r["done"]),
                 "cat": r["cat"] or "Inne",
@@ -125,6 +377,44 @@ def load_all():
                 "star": bool(r["star"]),
                 "created_seq": r["created_seq"],
                 "rep": bool(r["rep"]),
+                "time": r["time"],
+                "due_date": r["due_date"],
             }
         )
     return result
+
+
+@timed("db.load_series")
+def load_series():
+    """
+    Wczytuje wszystkie serie powtórzeń jako listę słowników:
+      {"id", "text", "cat", "pattern", "start" (ISO),
+       "exceptions", "done", "star" (listy dat ISO), "created_seq", "time"}
+    """
+    conn = _get_connection()
+    try:
+        rows = conn.execute(
+            """
+            SELECT id, text, cat, pattern, start, exceptions, done_dates, star_dates, created_seq, time
+            FROM series
+            ORDER BY created_seq ASC, id ASC
+            """
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return []
+
+    return [
+        {
+            "id": r["id"],
+            "text": r["text"],
+            "cat": r["cat"] or "Inne",
+            "pattern": r["pattern"],
+            "start": r["start"],
+            "exceptions": json.loads(r["exceptions"]),
+            "done": json.loads(r["done_dates"]),
+            "star": json.loads(r["star_dates"]),
+            "created_seq": r["created_seq"],
+            "time": r["time"],
+        }
+        for r in rows
+    ]
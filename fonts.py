@@ -0,0 +1,72 @@
+# fonts.py
+
+import tkinter.font as tkfont
+from config import sizes
+
+FAMILY = "Segoe UI"
+
+# Wspólne fonty dla całej aplikacji – jeden obiekt tkfont.Font na rolę,
+# zamiast nowych fontów w każdym wierszu.
+# rola: (klucz w sizes(), przesunięcie rozmiaru, minimalny rozmiar, pogrubienie, przekreślenie)
+ROLES = {
+    "title": ("title", 0, 0, True, False),
+    "subtitle": ("subtitle", 0, 0, False, False),
+    "subtitle_bold": ("subtitle", 0, 0, True, False),
+    "entry": ("entry", 0, 0, False, False),
+    "button": ("button", 0, 0, True, False),
+    "star": ("button", 0, 10, True, False),
+    "date": ("button", -1, 8, False, False),
+    "task": ("task", 0, 0, True, False),
+    "task_done": ("task", 0, 0, True, True),
+}
+
+_fonts: dict[str, tkfont.Font] = {}
+_sizes = sizes(False)
+
+
+def _options(role: str, s: dict) -> dict:
+    key, delta, minimum, bold, overstrike = ROLES[role]
+    return dict(
+        family=FAMILY,
+        size=max(s[key] + delta, minimum),
+        weight="bold" if bold else "normal",
+        overstrike=1 if overstrike else 0,
+    )
+
+
+def get(role: str) -> tkfont.Font:
+    """Zwraca wspólny font dla roli (tworzy go przy pierwszym użyciu – potrzebne tk.Tk())."""
+    font = _fonts.get(role)
+    if font is None:
+        font = tkfont.Font(**_options(role, _sizes))
+        _fonts[role] = font
+    return font
+
+
+def use_sizes(s: dict):
+    """
+    Ustawia rozmiary z sizes(zoomed). Istniejące fonty są zmieniane w miejscu,
+    więc wszystkie widgety, które ich używają, przerysują się same.
+    """
+    global _sizes
+    if s == _sizes:
+        return
+    _sizes = dict(s)
+    for role, font in _fonts.items():
+        font.configure(**_options(role, _sizes))
+
+
+def fit(text: str, font: tkfont.Font, width: int) -> str:
+    """Tekst w JEDNEJ linii: przycięty z "…", jeśli nie mieści się w width px (szukanie binarne)."""
+    if width <= 0:
+        return ""
+    if font.measure(text) <= width:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.measure(text[:mid] + "…") <= width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "…"
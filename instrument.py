@@ -0,0 +1,165 @@
+# instrument.py
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from config import APP_DIR, ensure_app_dir
+
+# Pomiary są WYŁĄCZONE, dopóki ktoś ich nie włączy:
+#   MAJA_PROFILE=1 python main.py     albo     Ctrl+Alt+I w aplikacji.
+# Wyłączone kosztują jedno sprawdzenie flagi na wywołanie.
+_enabled = os.environ.get("MAJA_PROFILE", "") not in ("", "0")
+
+# górne granice koszyków histogramu (ms); ostatni koszyk = wszystko powyżej
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+_lock = threading.Lock()  # zapis mierzymy też na wątku zapisu
+_timings = {}   # nazwa -> {"count", "total", "max", "hist": [...]}
+_actions = {}   # akcja użytkownika -> liczba
+_saves = {}     # akcja użytkownika -> liczba zapisów oddanych do bazy
+_current_action = None
+_action_hooks = []  # fn(nazwa, sekundy) po każdej akcji (też przy wyłączonych pomiarach)
+_sections = {}      # dodatkowe części raportu: nazwa -> fn() zwracająca dict
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(value: bool = True):
+    global _enabled
+    _enabled = bool(value)
+
+
+def add_action_hook(fn):
+    """fn(nazwa, sekundy) – wołane po zakończeniu każdej akcji (np. stall_watchdog.py)."""
+    _action_hooks.append(fn)
+
+
+def remove_action_hook(fn):
+    if fn in _action_hooks:
+        _action_hooks.remove(fn)
+
+
+def add_section(name: str, fn):
+    """Dodatkowa część summary() pod kluczem name (fn() -> dict)."""
+    _sections[name] = fn
+
+
+def reset():
+    with _lock:
+        _timings.clear()
+        _actions.clear()
+        _saves.clear()
+
+
+def record(name: str, seconds: float):
+    """Dopisuje jeden pomiar czasu do statystyk name."""
+    ms = seconds * 1000
+    with _lock:
+        stat = _timings.get(name)
+        if stat is None:
+            stat = _timings[name] = {"count": 0, "total": 0.0, "max": 0.0, "hist": [0] * (len(BUCKETS_MS) + 1)}
+        stat["count"] += 1
+        stat["total"] += ms
+        stat["max"] = max(stat["max"], ms)
+        for i, limit in enumerate(BUCKETS_MS):
+            if ms < limit:
+                break
+        else:
+            i = len(BUCKETS_MS)
+        stat["hist"][i] += 1
+
+
+def timed(name: str):
+    """Dekorator: mierzy czas wywołań funkcji (tylko gdy pomiary są włączone)."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def action(name: str):
+    """
+    Akcja użytkownika (kliknięcie, Enter...) – zapisy w jej trakcie liczą się do niej.
+    Działa jako blok with albo dekorator metody.
+    """
+    global _current_action
+    if not _enabled and not _action_hooks:
+        yield
+        return
+    previous, _current_action = _current_action, name
+    if _enabled:
+        with _lock:
+            _actions[name] = _actions.get(name, 0) + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current_action = previous
+        elapsed = time.perf_counter() - start
+        if _enabled:
+            record("action." + name, elapsed)
+        for hook in _action_hooks:
+            hook(name, elapsed)
+
+
+def count_save():
+    """Jeden zapis oddany do bazy – przypisany do bieżącej akcji."""
+    if not _enabled:
+        return
+    key = _current_action or "(inne)"
+    with _lock:
+        _saves[key] = _saves.get(key, 0) + 1
+
+
+def summary() -> dict:
+    """Podsumowanie: czasy (liczba, średnia, max, histogram) i zapisy na akcję."""
+    with _lock:
+        timings = {
+            name: {
+                "count": s["count"],
+                "mean_ms": round(s["total"] / s["count"], 3),
+                "max_ms": round(s["max"], 3),
+                "total_ms": round(s["total"], 3),
+                "hist": dict(zip([f"<{b}" for b in BUCKETS_MS] + [f">={BUCKETS_MS[-1]}"], s["hist"])),
+            }
+            for name, s in sorted(_timings.items())
+        }
+        saves = {
+            name: {
+                "actions": _actions.get(name, 0),
+                "saves": n,
+                "saves_per_action": round(n / _actions[name], 3) if _actions.get(name) else None,
+            }
+            for name, n in sorted(_saves.items())
+        }
+        actions = dict(sorted(_actions.items()))
+    result = {"timings": timings, "actions": actions, "saves": saves}
+    for name, fn in _sections.items():
+        result[name] = fn()
+    return result
+
+
+def dump(path: Path | None = None) -> Path:
+    """Zapisuje summary() do pliku JSON w APP_DIR (albo podanego) i zwraca ścieżkę."""
+    if path is None:
+        ensure_app_dir()
+        path = APP_DIR / f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    Path(path).write_text(json.dumps(summary(), ensure_ascii=False, indent=2), encoding="utf-8")
+    return Path(path)
@@ -1,12 +1,15 @@
 # main.py
 
+import startup  # pierwszy import: od niego liczymy czas startu (MAJA_STARTUP=1)
 import tkinter as tk
 from app import TodoApp
 
 if __name__ == "__main__":
+    startup.mark("imports")
     root = tk.Tk()
 
-    # tworzymy aplikację (ona sama ustawia geometry, fullscreen button itd.)
+    # tworzymy aplikację (ona sama ustawia geometry, fullscreen button itd.);
+    # zadania wczytują się dopiero po pierwszym narysowaniu okna
     app = TodoApp(root)
 
     # zamykanie okna z X w rogu -> też zapisuje
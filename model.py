@@ -0,0 +1,272 @@
+# model.py
+
+from bisect import bisect_left
+from datetime import date
+
+from powtarzanie import meta_to_ddmm_date, series_dates
+
+
+class Task:
+    """
+    Dane jednego zadania – bez żadnych widgetów Tk.
+    Widok (TaskRow) tylko je wyświetla, więc tysiące zadań nie oznaczają
+    tysięcy widgetów.
+    __slots__ = mniej pamięci na zadanie (bez __dict__) przy dużych listach.
+    """
+
+    __slots__ = (
+        "text", "cat", "meta", "time", "due", "done", "star",
+        "created_seq", "is_repeat", "db_id", "series",
+    )
+
+    def __init__(
+        self,
+        text,
+        cat="Inne",
+        meta=None,
+        done=False,
+        star=False,
+        created_seq=None,
+        is_repeat=False,
+        db_id=None,
+        due=None,
+        series=None,
+        time=None,
+    ):
+        self.text = str(text)
+        self.cat = str(cat or "Inne")
+        self.meta = meta                  # 'dd.mm' lub None
+        self.time = time or None          # godzina przypomnienia 'gg:mm' lub None
+        # data z meta – liczona raz (przy tworzeniu), nie przy każdym filtrze
+        self.due = due if due is not None else meta_to_ddmm_date(meta)
+        self.done = bool(done)
+        self.star = bool(star)
+        self.created_seq = created_seq
+        self.is_repeat = bool(is_repeat)  # czy to element serii powtórzeń
+        self.db_id = db_id                # id wiersza w bazie (None dla wystąpień serii)
+        self.series = series              # Series, jeśli to wystąpienie serii powtórzeń
+
+    # Akcesory (te same nazwy co wcześniej w TaskRow)
+    def is_done(self) -> bool:
+        return self.done
+
+    def get_text(self) -> str:
+        return self.text
+
+    def get_cat(self) -> str:
+        return self.cat
+
+    def get_meta(self):
+        return self.meta
+
+    def get_time(self):
+        return self.time
+
+    def get_starred(self) -> bool:
+        return self.star
+
+    def get_is_repeat(self) -> bool:
+        return self.is_repeat
+
+    def set_done(self, value: bool):
+        self.done = bool(value)
+
+    def set_starred(self, value: bool):
+        self.star = bool(value)
+
+
+class Series:
+    """
+    Zadanie powtarzalne zapisane RAZ jako reguła (wzorzec + data startu).
+    Wystąpienia nie są przechowywane – aplikacja rozwija je tylko dla okna
+    dat, które może być widoczne (dates_in). Przechowujemy jedynie wyjątki:
+    usunięte wystąpienia oraz daty odhaczone / przypięte gwiazdką.
+    """
+
+    __slots__ = (
+        "text", "cat", "pattern", "start", "time", "created_seq", "db_id",
+        "exceptions", "done", "star",
+    )
+
+    def __init__(
+        self,
+        text,
+        cat,
+        pattern,
+        start: date,
+        created_seq=None,
+        db_id=None,
+        exceptions=(),
+        done=(),
+        star=(),
+        time=None,
+    ):
+        self.text = str(text)
+        self.cat = str(cat or "Inne")
+        self.pattern = pattern
+        self.start = start
+        self.time = time or None          # godzina przypomnienia wspólna dla wystąpień
+        self.created_seq = created_seq
+        self.db_id = db_id
+        self.exceptions: set[date] = set(exceptions)
+        self.done: set[date] = set(done)
+        self.star: set[date] = set(star)
+
+    def dates_in(self, first: date, last: date) -> list[date]:
+        """Daty wystąpień w oknie [first, last] (bez usuniętych)."""
+        return [
+            d for d in series_dates(self.pattern, self.start, first, last)
+            if d not in self.exceptions
+        ]
+
+    def set_done(self, day: date, value: bool):
+        (self.done.add if value else self.done.discard)(day)
+
+    def set_starred(self, day: date, value: bool):
+        (self.star.add if value else self.star.discard)(day)
+
+    def prune_before(self, day: date) -> bool:
+        """Zapomina wyjątki sprzed day (te dni i tak nie są już pokazywane). True = coś zmieniono."""
+        changed = False
+        for dates in (self.exceptions, self.done, self.star):
+            old = {d for d in dates if d < day}
+            if old:
+                dates.difference_update(old)
+                changed = True
+        return changed
+
+    def to_data(self) -> dict:
+        """Format db.write_batch / db.load_series (daty jako ISO)."""
+        return {
+            "id": self.db_id,
+            "text": self.text,
+            "cat": self.cat,
+            "pattern": self.pattern,
+            "start": self.start.isoformat(),
+            "exceptions": [d.isoformat() for d in self.exceptions],
+            "done": [d.isoformat() for d in self.done],
+            "star": [d.isoformat() for d in self.star],
+            "created_seq": self.created_seq,
+            "time": self.time,
+        }
+
+    @classmethod
+    def from_data(cls, item: dict) -> "Series":
+        return cls(
+            item.get("text", ""),
+            item.get("cat", "Inne"),
+            item["pattern"],
+            date.fromisoformat(item["start"]),
+            created_seq=item.get("created_seq"),
+            db_id=item.get("id"),
+            exceptions=map(date.fromisoformat, item.get("exceptions", ())),
+            done=map(date.fromisoformat, item.get("done", ())),
+            star=map(date.fromisoformat, item.get("star", ())),
+            time=item.get("time"),
+        )
+
+
+class DateIndex:
+    """
+    Indeks: data (Task.due, czyli meta 'dd.mm') -> zadania na ten dzień.
+    Aktualizowany przy dodaniu i usunięciu zadania (data zadania się nie
+    zmienia), więc filtry "Dzisiaj"/"Jutro" i przypomnienia biorą gotowy
+    koszyk zamiast parsować meta każdego zadania.
+    """
+
+    def __init__(self):
+        self._buckets: dict[date, dict[Task, None]] = {}
+        self._dates: dict[Task, date | None] = {}
+
+    def add(self, task: Task):
+        d = task.due
+        self._dates[task] = d
+        if d is not None:
+            self._buckets.setdefault(d, {})[task] = None
+
+    def remove(self, task: Task):
+        d = self._dates.pop(task, None)
+        if d is None:
+            return
+        bucket = self._buckets.get(d)
+        if bucket is not None:
+            bucket.pop(task, None)
+            if not bucket:
+                del self._buckets[d]
+
+    def on(self, day: date) -> list[Task]:
+        """Zadania na dany dzień (w kolejności dodania)."""
+        return list(self._buckets.get(day, ()))
+
+    def clear(self):
+        self._buckets.clear()
+        self._dates.clear()
+
+
+class TaskOrder:
+    """
+    Zadania w kolejności wyświetlania: przypięte (★) najpierw, potem wg created_seq.
+    Lista jest cały czas posortowana – dodanie / usunięcie / przepięcie gwiazdki
+    to wyszukiwanie binarne, a nie sortowanie wszystkiego od nowa.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._items: list[Task] = []
+        self._key_of: dict[Task, tuple] = {}
+
+    @staticmethod
+    def _key(task: Task) -> tuple:
+        seq = task.created_seq if task.created_seq is not None else -1
+        # wystąpienia jednej serii mają wspólne created_seq – dalej kolejność wg daty
+        due = task.due.toordinal() if task.due else 0
+        return (not task.star, seq, due, task.db_id or 0)
+
+    def add(self, task: Task):
+        key = self._key(task)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, task)
+        self._key_of[task] = key
+
+    def remove(self, task: Task):
+        key = self._key_of.pop(task)
+        i = bisect_left(self._keys, key)
+        while self._items[i] is not task:  # (teoretycznie) kilka zadań z tym samym kluczem
+            i += 1
+        del self._keys[i]
+        del self._items[i]
+
+    def remove_many(self, tasks):
+        """Usuwa wiele zadań jednym przejściem listy (zamiast remove() dla każdego)."""
+        for task in tasks:
+            self._key_of.pop(task, None)
+        self._items = [t for t in self._items if t in self._key_of]
+        self._keys = [self._key_of[t] for t in self._items]
+
+    def reposition(self, task: Task):
+        """Po zmianie gwiazdki – przenosi zadanie na właściwe miejsce."""
+        self.remove(task)
+        self.add(task)
+
+    def ordered(self, tasks) -> list[Task]:
+        """Podzbiór zadań (np. koszyk z DateIndex) w kolejności wyświetlania."""
+        return sorted(tasks, key=self._key_of.__getitem__)
+
+    def items(self) -> list[Task]:
+        """Wszystkie zadania w kolejności wyświetlania (lista tylko do odczytu)."""
+        return self._items
+
+    def clear(self):
+        self._keys.clear()
+        self._items.clear()
+        self._key_of.clear()
+
+    def __contains__(self, task) -> bool:
+        return task in self._key_of
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,220 @@
+# notifications.py
+
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import tkinter as tk
+
+import fonts
+import styles
+
+# jak długo (ms) toast w oknie aplikacji zostaje na ekranie
+TOAST_MS = 6000
+# to samo powiadomienie w tym oknie czasu (s) pokazujemy tylko raz
+COALESCE_S = 60
+
+_STOP = object()
+
+
+# ================== Backendy ==================
+# Backend to obiekt z metodą show(title, message) i flagą threaded:
+#   threaded = False – wołany na wątku Tk (musi wrócić od razu),
+#   threaded = True  – wołany na wątku powiadomień (może blokować, NIE dotyka Tk).
+
+class NullBackend:
+    """Nic nie pokazuje, tylko zapamiętuje (testy / MAJA_NOTIFY=null)."""
+
+    threaded = False
+
+    def __init__(self):
+        self.sent = []
+
+    def show(self, title, message):
+        self.sent.append((title, message))
+
+
+class CommandBackend:
+    """Powiadomienie systemowe przez polecenie, np. notify-send (Linux)."""
+
+    threaded = True
+
+    def __init__(self, command=("notify-send", "--app-name=Planer Maji")):
+        self.command = tuple(command)
+
+    @classmethod
+    def available(cls) -> bool:
+        import shutil
+        return shutil.which("notify-send") is not None
+
+    def show(self, title, message):
+        import subprocess  # tylko na wątku powiadomień, nie przy starcie
+        subprocess.run(self.command + (title, message), timeout=10, check=False)
+
+
+class Win10ToastBackend:
+    """Powiadomienia Windows (win10toast). Notifier powstaje na wątku powiadomień."""
+
+    threaded = True
+
+    def __init__(self):
+        self._toaster = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith("win"):
+            return False
+        try:
+            import win10toast  # type: ignore  # noqa: F401
+        except Exception:
+            return False
+        return True
+
+    def show(self, title, message):
+        if self._toaster is None:
+            from win10toast import ToastNotifier  # type: ignore
+            self._toaster = ToastNotifier()
+        # jesteśmy już na osobnym wątku – czekanie na toast nie blokuje okna
+        self._toaster.show_toast(title, message, duration=10, threaded=False)
+
+
+class ToastOverlay:
+    """
+    Toast w rogu okna aplikacji (zamiast modalnego messagebox).
+    Nie blokuje mainloopa: pokazuje się, po TOAST_MS znika sam,
+    kliknięcie zamyka go od razu. Kolejne powiadomienia czekają w kolejce.
+    """
+
+    threaded = False
+
+    def __init__(self, root, duration_ms: int = TOAST_MS):
+        self.root = root
+        self.duration_ms = duration_ms
+        self._frame = None
+        self._pending = []
+        self._hide_id = None
+
+    def show(self, title, message):
+        self._pending.append((title, message))
+        if self._hide_id is None:
+            self._show_next()
+
+    def _build(self):
+        # kolory z palety motywu (styles.bind) – po zmianie motywu toast też się zmienia
+        self._frame = styles.bind(
+            tk.Frame(self.root, highlightthickness=2),
+            bg="CARD", highlightbackground="ACCENT", highlightcolor="ACCENT",
+        )
+        self._title = styles.bind(
+            tk.Label(self._frame, font=fonts.get("subtitle_bold"), anchor="w", justify="left"),
+            bg="CARD", fg="TEXT",
+        )
+        self._title.pack(fill="x", padx=12, pady=(8, 2))
+        self._message = styles.bind(
+            tk.Label(
+                self._frame, font=fonts.get("subtitle"),
+                anchor="w", justify="left", wraplength=320,
+            ),
+            bg="CARD", fg="TEXT",
+        )
+        self._message.pack(fill="x", padx=12, pady=(0, 10))
+        for w in (self._frame, self._title, self._message):
+            w.bind("<Button-1>", lambda _e: self._hide())
+
+    def _show_next(self):
+        if not self._pending:
+            return
+        title, message = self._pending.pop(0)
+        # pierwszy toast (albo okno zniszczone, np. w testach) – budujemy od nowa
+        if self._frame is None or not self._frame.winfo_exists():
+            self._build()
+        self._title.configure(text=title)
+        self._message.configure(text=message)
+        self._frame.place(relx=1.0, rely=1.0, x=-16, y=-16, anchor="se")
+        self._frame.lift()
+        self._hide_id = self.root.after(self.duration_ms, self._hide)
+
+    def _hide(self):
+        if self._hide_id is not None:
+            self.root.after_cancel(self._hide_id)
+            self._hide_id = None
+        if self._frame is not None and self._frame.winfo_exists():
+            self._frame.place_forget()
+        self._show_next()
+
+
+def default_backends(root) -> list:
+    """
+    Zestaw backendów dla tej maszyny: toast w oknie zawsze,
+    a do tego powiadomienie systemowe, jeśli jest dostępne.
+    MAJA_NOTIFY=null wyłącza wszystko (testy).
+    """
+    if os.environ.get("MAJA_NOTIFY") == "null":
+        return [NullBackend()]
+    backends = [ToastOverlay(root)]
+    if Win10ToastBackend.available():
+        backends.append(Win10ToastBackend())
+    elif CommandBackend.available():
+        backends.append(CommandBackend())
+    return backends
+
+
+# ================== Dyspozytor ==================
+class NotificationDispatcher:
+    """
+    Jedno miejsce, przez które idą wszystkie powiadomienia (wołane z wątku Tk).
+    notify() nigdy nie blokuje: backendy "w oknie" dostają powiadomienie od razu,
+    a systemowe (threaded) – przez kolejkę na osobnym wątku.
+    Takie samo powiadomienie (tytuł + treść) w ciągu COALESCE_S sekund
+    pokazujemy tylko raz.
+    """
+
+    def __init__(self, backends, coalesce_s: float = COALESCE_S):
+        self.backends = list(backends)
+        self._coalesce_s = coalesce_s
+        self._recent = {}  # (tytuł, treść) -> czas ostatniego wysłania (monotonic)
+        self._queue = queue.Queue()
+        self._thread = None
+        if any(b.threaded for b in self.backends):
+            self._thread = threading.Thread(target=self._run, name="planer-notify", daemon=True)
+            self._thread.start()
+
+    def notify(self, title: str, message: str) -> bool:
+        """Wysyła powiadomienie. False = pominięte jako duplikat."""
+        now = time.monotonic()
+        key = (title, message)
+        last = self._recent.get(key)
+        if last is not None and now - last < self._coalesce_s:
+            return False
+        self._recent = {k: t for k, t in self._recent.items() if now - t < self._coalesce_s}
+        self._recent[key] = now
+
+        for backend in self.backends:
+            if backend.threaded:
+                self._queue.put((backend, title, message))
+            else:
+                self._deliver(backend, title, message)
+        return True
+
+    def close(self, timeout: float | None = 1.0):
+        """Kończy wątek powiadomień (przy wyjściu z aplikacji)."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    @staticmethod
+    def _deliver(backend, title, message):
+        try:
+            backend.show(title, message)
+        except Exception:
+            # brak powiadomienia nie może zatrzymać aplikacji
+            traceback.print_exc()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._deliver(*item)
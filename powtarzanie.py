@@ -1,4 +1,5 @@
-from datetime import date, timedelta
+from datetime import date, time, timedelta
+from functools import lru_cache
 import re
 
 # ile elementów generować przy automatycznych powtórzeniach
@@ -12,6 +13,11 @@ REPEAT_OPTIONS = [
     "Co czwartek", "Co piątek", "Co sobota", "Co niedziela",
 ]
 
+# wzorzec meta 'dd.mm' – kompilowany raz
+DDMM_RE = re.compile(r"(\d{1,2})\.(\d{1,2})")
+# godzina przypomnienia 'gg:mm' (dopuszczamy też 'gg.mm')
+HHMM_RE = re.compile(r"(\d{1,2})[:.](\d{2})")
+
 WEEKDAY_MAP = {
     "Co poniedziałek": 0,
     "Co wtorek": 1,
@@ -28,24 +34,60 @@ def fmt_ddmm(d: date) -> str:
     return f"{d.day:02d}.{d.month:02d}"
 
 
-def meta_to_ddmm_date(meta: str | None) -> date | None:
+@lru_cache(maxsize=1024)
+def parse_ddmm(meta: str) -> tuple[int, int] | None:
+    """
+    Rozbiera meta 'dd.mm' na (dzień, miesiąc) – bez roku, więc wynik można
+    bezpiecznie trzymać w cache (LRU, ograniczony rozmiar).
+    Błędne meta -> None.
+    """
+    match = DDMM_RE.fullmatch(meta.strip().replace(" ", ""))
+    if not match:
+        return None
+    d_str, mo_str = match.groups()
+    return int(d_str), int(mo_str)
+
+
+def meta_to_ddmm_date(meta: str | None, year: int | None = None) -> date | None:
     """
-    Zamienia meta typu 'dd.mm' na obiekt date (z bieżącym rokiem).
+    Zamienia meta typu 'dd.mm' na obiekt date (z bieżącym rokiem albo podanym year).
     Jeśli meta jest puste albo błędne – zwraca None.
     """
     if not meta:
         return None
-    m = str(meta).strip().replace(" ", "")
-    match = re.fullmatch(r"(\d{1,2})\.(\d{1,2})", m)
-    if not match:
+    parsed = parse_ddmm(str(meta))
+    if parsed is None:
         return None
-    d_str, mo_str = match.groups()
+    day, month = parsed
     try:
-        return date(date.today().year, int(mo_str), int(d_str))
+        return date(year or date.today().year, month, day)
     except ValueError:
         return None
 
 
+@lru_cache(maxsize=256)
+def parse_hhmm(text: str) -> time | None:
+    """Godzina 'gg:mm' -> time. Puste albo błędne -> None."""
+    match = HHMM_RE.fullmatch(text.strip())
+    if not match:
+        return None
+    h, m = int(match.group(1)), int(match.group(2))
+    if h > 23 or m > 59:
+        return None
+    return time(h, m)
+
+
+def fmt_hhmm(t: time) -> str:
+    """Zwraca godzinę w formacie gg:mm."""
+    return f"{t.hour:02d}:{t.minute:02d}"
+
+
+def metas_to_dates(metas) -> list[date | None]:
+    """Zamienia całą listę meta na daty w jednym przebiegu (jedno date.today())."""
+    year = date.today().year
+    return [meta_to_ddmm_date(meta, year) for meta in metas]
+
+
 def next_weekday(start_from: date, weekday: int) -> date:
     """
     Zwraca pierwszą datę (po start_from), która wypada w dany dzień tygodnia.
@@ -89,3 +131,42 @@ def generate_repeats(pattern: str, start_from: date) -> list[date]:
             dates.append(first + timedelta(days=7 * i))
 
     return dates
+
+
+def _repeat_rule(pattern: str, start_from: date) -> tuple[date, int] | None:
+    """
+    Reguła serii jako (pierwsze powtórzenie, krok w dniach) – te same zasady
+    co w generate_repeats, ale bez limitu liczby powtórzeń.
+    """
+    if pattern == "Codziennie":
+        return start_from + timedelta(days=1), 1
+    if pattern == "Co tydzień":
+        return start_from + timedelta(days=7), 7
+    if pattern == "Co weekend":
+        return next_weekday(start_from, 5), 7
+    if pattern in WEEKDAY_MAP:
+        return next_weekday(start_from, WEEKDAY_MAP[pattern]), 7
+    return None
+
+
+def series_dates(pattern: str, start_from: date, first: date, last: date) -> list[date]:
+    """
+    Daty wystąpień serii (sam start_from + powtórzenia) w oknie [first, last].
+    Liczone "na żądanie" tylko dla okna, więc seria może trwać dowolnie długo.
+    """
+    dates: list[date] = []
+    if first <= start_from <= last:
+        dates.append(start_from)
+
+    rule = _repeat_rule(pattern, start_from)
+    if rule is None:
+        return dates
+    d, step = rule
+    if d < first:
+        # przeskocz od razu do pierwszego wystąpienia w oknie
+        skip = -(-(first - d).days // step)
+        d += timedelta(days=skip * step)
+    while d <= last:
+        dates.append(d)
+        d += timedelta(days=step)
+    return dates
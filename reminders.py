@@ -0,0 +1,92 @@
+# reminders.py
+
+import heapq
+import itertools
+from datetime import datetime
+
+# najdłuższe pojedyncze czekanie (ms) – po uśpieniu komputera / zmianie zegara
+# harmonogram sam się poprawi najpóźniej po tym czasie
+MAX_WAIT_MS = 15 * 60 * 1000
+
+
+class ReminderScheduler:
+    """
+    Przypomnienia o konkretnej godzinie bez cyklicznego przeglądania zadań.
+
+    Terminy siedzą w kopcu (heapq) – najbliższy jest zawsze na wierzchu,
+    a w Tk czeka tylko JEDNO root.after, ustawione na ten najbliższy termin.
+    Dodanie / zmiana / usunięcie zadania to O(log n): stare wpisy w kopcu
+    nie są wyszukiwane, tylko ignorowane, gdy wyjdą na wierzch
+    (aktualny termin zadania trzymamy w słowniku _when).
+
+    on_due(zadania) dostaje listę zadań, których czas właśnie minął.
+    """
+
+    def __init__(self, root, on_due):
+        self.root = root
+        self.on_due = on_due
+        self._heap = []                   # (kiedy, licznik, zadanie)
+        self._when = {}                   # zadanie -> aktualny termin
+        self._counter = itertools.count()  # remisy w kopcu bez porównywania zadań
+        self._after_id = None
+        self._armed_for = None            # termin, na który ustawione jest after
+
+    def schedule(self, task, when: datetime | None):
+        """Ustawia (albo zmienia) termin przypomnienia zadania; None = bez przypomnienia."""
+        if when is None or when <= datetime.now():
+            self.cancel(task)
+            return
+        if self._when.get(task) == when:
+            return
+        self._when[task] = when
+        heapq.heappush(self._heap, (when, next(self._counter), task))
+        self._arm()
+
+    def cancel(self, task):
+        """Zadanie bez przypomnienia (odhaczone / usunięte). Wpis w kopcu wygaśnie sam."""
+        if self._when.pop(task, None) is not None:
+            self._arm()
+
+    def clear(self):
+        """Bez żadnych przypomnień (np. przy zamykaniu okna) – anuluje też czekające after."""
+        self._heap.clear()
+        self._when.clear()
+        self._arm()
+
+    def __len__(self) -> int:
+        return len(self._when)
+
+    # ---------- after ----------
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self._when.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _arm(self):
+        """Ustawia after na najbliższy termin (tylko jeśli się zmienił)."""
+        self._drop_stale()
+        when = self._heap[0][0] if self._heap else None
+        if when == self._armed_for:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._armed_for = when
+        if when is not None:
+            delay_ms = int((when - datetime.now()).total_seconds() * 1000)
+            self._after_id = self.root.after(min(max(delay_ms, 0), MAX_WAIT_MS), self._fire)
+
+    def _fire(self):
+        self._after_id = None
+        self._armed_for = None
+        now = datetime.now()
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            when, _n, task = heapq.heappop(heap)
+            if self._when.get(task) == when:
+                del self._when[task]
+                due.append(task)
+        if due:
+            self.on_due(due)
+        self._arm()
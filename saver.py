@@ -0,0 +1,180 @@
+# saver.py
+
+import queue
+import threading
+import time
+import traceback
+
+from config import SAVE_DEBOUNCE_MS, SAVE_RETRY_MS
+
+_STOP = object()
+
+
+class WriteBehindSaver:
+    """
+    Zapis "w tle" (write-behind) na osobnym wątku.
+
+    Interfejs (wątek Tk) wrzuca do kolejki tylko zmiany:
+      submit({klucz: dane albo None (= usuń)})
+    np. klucz ("tasks", id). Wątek zapisu zbiera wszystko, co przyjdzie
+    w oknie window_ms od pierwszej zmiany, skleja zmiany tego samego klucza
+    (wygrywa ostatnia) i woła write_fn(zmiany) – jeden commit na całą paczkę.
+    write_fn NIE może dotykać widgetów Tk.
+    call(fn) wykonuje fn na wątku zapisu PO wszystkich wcześniejszych zmianach
+    (np. kopia zapasowa bazy).
+    on_stop (opcjonalne) jest wołane na wątku zapisu tuż przed jego końcem,
+    np. żeby zamknąć połączenie z bazą należące do tego wątku.
+
+    Nieudany zapis nie przepada: paczka (i wszystko, co przyszło po niej,
+    w tej samej kolejności) czeka i idzie jeszcze raz – z następną zmianą,
+    przy flush()/close() albo po retry_ms. on_error(wyjątek) – też na wątku
+    zapisu – dostaje każdy błąd zapisu, a on_error(None), gdy zapis znów się udał.
+    """
+
+    def __init__(self, write_fn, window_ms: int = SAVE_DEBOUNCE_MS, on_stop=None, on_error=None,
+                 retry_ms: int = SAVE_RETRY_MS):
+        self._write = write_fn
+        self._on_stop = on_stop
+        self._on_error = on_error
+        self._window = max(0, window_ms) / 1000.0
+        self._retry = max(1, retry_ms) / 1000.0
+        self._backlog = []   # po nieudanym zapisie: [paczka, call()/paczki po niej...] (tylko wątek zapisu)
+        self._failing = False
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="planer-saver", daemon=True)
+        self._thread.start()
+
+    def submit(self, changes: dict):
+        """Dodaje zmiany do kolejki (nie blokuje)."""
+        if changes:
+            self._queue.put(dict(changes))
+
+    def call(self, fn):
+        """Kolejkuje fn() na wątek zapisu (po zmianach, które już czekają)."""
+        if self._thread.is_alive():
+            self._queue.put(fn)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Czeka, aż wszystko, co już jest w kolejce, trafi do bazy
+        (przy błędzie zapisu – aż do kolejnej nieudanej próby; zmiany czekają dalej).
+        """
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None):
+        """Zapisuje zaległe zmiany i kończy wątek (np. przy wyjściu z aplikacji)."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    # ---------- wątek zapisu ----------
+    def _run(self):
+        try:
+            self._loop()
+        finally:
+            if self._on_stop:
+                self._on_stop()
+
+    def _loop(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._retry if self._backlog else None)
+            except queue.Empty:
+                self._drain()  # ponawiamy zaległy zapis
+                continue
+            if item is _STOP:
+                self._drain()
+                return
+            if isinstance(item, threading.Event):
+                self._drain()
+                item.set()
+                continue
+            if self._backlog:
+                # coś już czeka po błędzie – nowe zmiany i call() ustawiają się za tym
+                self._defer(item)
+                self._drain()
+                continue
+            if callable(item):
+                self._safe(item)
+                continue
+
+            pending = dict(item)
+            waiters = []
+            calls = []
+            stop = False
+            deadline = time.monotonic() + self._window
+            # zbieramy kolejne zmiany aż do końca okna (albo prośby o flush/stop)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                if callable(item):
+                    calls.append(item)
+                    break
+                pending.update(item)
+
+            if self._write_batch(pending):
+                for fn in calls:
+                    self._safe(fn)
+            else:
+                # call() (np. DELETE ... WHERE done=1) nie może wyprzedzić tych zmian
+                self._backlog = [pending] + calls
+            for w in waiters:
+                w.set()
+            if stop:
+                self._drain()  # ostatnia próba przed końcem wątku
+                return
+
+    def _write_batch(self, changes) -> bool:
+        try:
+            self._write(changes)
+        except Exception as e:
+            traceback.print_exc()
+            self._failing = True
+            if self._on_error:
+                self._safe(self._on_error, e)
+            return False
+        if self._failing:
+            self._failing = False
+            if self._on_error:
+                self._safe(self._on_error, None)
+        return True
+
+    def _defer(self, item):
+        """Dokłada element kolejki za zaległymi (kolejne paczki zmian sklejamy)."""
+        if not callable(item) and self._backlog and isinstance(self._backlog[-1], dict):
+            self._backlog[-1].update(item)
+        else:
+            self._backlog.append(item if callable(item) else dict(item))
+
+    def _drain(self):
+        """Zaległe paczki i call() po kolei – aż do pierwszego nieudanego zapisu."""
+        while self._backlog:
+            item = self._backlog[0]
+            if callable(item):
+                self._safe(item)
+            elif not self._write_batch(item):
+                return
+            self._backlog.pop(0)
+
+    @staticmethod
+    def _safe(fn, *args):
+        try:
+            fn(*args)
+        except Exception:
+            # nie zabijaj wątku – kolejne zmiany dalej mają szansę się zapisać
+            traceback.print_exc()
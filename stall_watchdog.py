@@ -0,0 +1,106 @@
+# stall_watchdog.py
+
+import heapq
+import time
+from collections import deque
+from datetime import datetime
+
+import instrument
+
+# co ile ms bije "serce" i od jakiego opóźnienia (ms) uznajemy, że okno zamarło
+HEARTBEAT_MS = 100
+STALL_MS = 200
+# ile najgorszych zacięć i ile ostatnich pamiętamy
+KEEP_WORST = 20
+KEEP_RECENT = 50
+
+UNKNOWN = "(nieznany)"
+
+
+class StallWatchdog:
+    """
+    Wykrywa zacięcia pętli Tk (mainloop): co HEARTBEAT_MS ustawia root.after
+    i sprawdza, o ile później niż powinno się wykonało. Jeśli spóźnienie
+    przekracza STALL_MS, ktoś blokował wątek Tk – winnym jest najdłuższa
+    akcja (instrument.action), która skończyła się od poprzedniego "uderzenia".
+    Zacięcia poza akcjami (np. przewijanie, zmiana rozmiaru) mają handler
+    UNKNOWN.
+
+    Pamięta KEEP_WORST najgorszych i KEEP_RECENT ostatnich zacięć oraz
+    statystyki na handler; summary() trafia do raportu instrument.dump().
+    Hook akcji jest zapisany w instrument tylko między start() a stop().
+    """
+
+    def __init__(self, root, heartbeat_ms: int = HEARTBEAT_MS, stall_ms: int = STALL_MS):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_ms = stall_ms
+        self._after_id = None
+        self._expected = None
+        self._finished = []            # (nazwa, ms) akcji od ostatniego uderzenia
+        self._worst = []               # kopiec (ms, nr, wpis) – KEEP_WORST największych
+        self._recent = deque(maxlen=KEEP_RECENT)
+        self._by_handler = {}          # nazwa -> {"stalls", "worst_ms", "total_ms"}
+        self._counter = 0
+        instrument.add_section("stalls", self.summary)
+
+    def start(self):
+        if self._after_id is None:
+            self._finished.clear()
+            instrument.add_action_hook(self._on_action)
+            self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+            instrument.remove_action_hook(self._on_action)
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.heartbeat_ms / 1000
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    def _on_action(self, name, seconds):
+        self._finished.append((name, seconds * 1000))
+
+    def _beat(self):
+        lag_ms = (time.perf_counter() - self._expected) * 1000
+        if lag_ms >= self.stall_ms:
+            if self._finished:
+                handler, handler_ms = max(self._finished, key=lambda item: item[1])
+            else:
+                handler, handler_ms = UNKNOWN, None
+            self._record(lag_ms, handler, handler_ms)
+        self._finished.clear()
+        self._schedule()
+
+    def _record(self, lag_ms, handler, handler_ms):
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "lag_ms": round(lag_ms, 1),
+            "handler": handler,
+            "handler_ms": round(handler_ms, 1) if handler_ms is not None else None,
+        }
+        self._recent.append(entry)
+        self._counter += 1
+        item = (lag_ms, self._counter, entry)
+        if len(self._worst) < KEEP_WORST:
+            heapq.heappush(self._worst, item)
+        elif lag_ms > self._worst[0][0]:
+            heapq.heapreplace(self._worst, item)
+
+        stat = self._by_handler.setdefault(handler, {"stalls": 0, "worst_ms": 0.0, "total_ms": 0.0})
+        stat["stalls"] += 1
+        stat["worst_ms"] = round(max(stat["worst_ms"], lag_ms), 1)
+        stat["total_ms"] = round(stat["total_ms"] + lag_ms, 1)
+
+    def summary(self) -> dict:
+        """Najgorsze zacięcia, ostatnie zacięcia i ranking handlerów (wg łącznego czasu)."""
+        return {
+            "stall_ms": self.stall_ms,
+            "worst": [entry for _ms, _n, entry in sorted(self._worst, reverse=True)],
+            "recent": list(self._recent),
+            "by_handler": dict(sorted(
+                self._by_handler.items(), key=lambda item: item[1]["total_ms"], reverse=True
+            )),
+        }
@@ -0,0 +1,40 @@
+# startup.py
+#
+# Pomiar czasu startu (MAJA_STARTUP=1 python main.py).
+# main.py importuje ten moduł JAKO PIERWSZY, więc _T0 to praktycznie start programu.
+
+import os
+import sys
+import time
+
+_T0 = time.perf_counter()
+_enabled = os.environ.get("MAJA_STARTUP", "") not in ("", "0")
+_marks = []
+
+
+def mark(name: str):
+    """Zapamiętuje chwilę startu (ms od importu startup.py)."""
+    if _enabled:
+        _marks.append((name, (time.perf_counter() - _T0) * 1000))
+
+
+def report():
+    """Wypisuje etapy startu na stderr i dopisuje je do APP_DIR/startup.log."""
+    if not _enabled or not _marks:
+        return
+    line = "  ".join(f"{name}={ms:.1f}ms" for name, ms in _marks)
+    print(f"[start] {line}", file=sys.stderr)
+
+    from config import APP_DIR, ensure_app_dir
+    import instrument
+
+    if instrument.enabled():
+        for name, ms in _marks:
+            instrument.record("startup." + name, ms / 1000)
+    try:
+        ensure_app_dir()
+        with open(APP_DIR / "startup.log", "a", encoding="utf-8") as f:
+            f.write(time.strftime("%Y-%m-%d %H:%M:%S") + "  " + line + "\n")
+    except OSError:
+        pass
+    _marks.clear()
@@ -0,0 +1,401 @@
+# store.py
+
+from contextlib import contextmanager
+from datetime import date, timedelta
+from itertools import chain
+
+from config import SERIES_WINDOW_DAYS
+from instrument import timed
+from model import Task, Series, DateIndex, TaskOrder
+from powtarzanie import fmt_ddmm, metas_to_dates
+
+
+class TaskStore:
+    """
+    Wszystkie zadania aplikacji – BEZ Tk (da się go używać w skryptach,
+    testach i benchmarkach, także dla 100k zadań).
+
+    Trzyma:
+      - tasks   – TaskOrder: zadania w kolejności wyświetlania,
+      - dates   – DateIndex: data -> zadania (Dzisiaj/Jutro, przypomnienia),
+      - series  – id -> Series; ich wystąpienia rozwijamy tylko dla okna
+                  SERIES_WINDOW_DAYS dni od dzisiaj.
+
+    Zmiany:
+      - subscribe(fn) – fn(zdarzenie, zadanie) dla "added" / "removed" /
+        "changed", a na końcu operacji fn("committed", None),
+      - on_save(zmiany) – wołane raz na koniec operacji (albo bloku batch())
+        ze słownikiem {("tasks" | "series", id): dane albo None (= usuń)}.
+        Operacje hurtowe (delete_done, clear) dają zamiast N kluczy jeden
+        ("bulk", "done" | "all") – na początku słownika, bo baza ma je
+        wykonać PRZED resztą zmian z tej paczki.
+    """
+
+    def __init__(self, next_id=1, next_series_id=1, on_save=None, window_days=SERIES_WINDOW_DAYS):
+        self.tasks = TaskOrder()
+        self.dates = DateIndex()
+        self.series = {}           # id -> Series
+        self._occurrences = {}     # (id serii, data) -> Task
+        self._seq = 0              # kolejność tworzenia
+        self._next_id = next_id    # id nowym wierszom nadajemy sami
+        self._next_series_id = next_series_id
+        self.window_days = window_days
+        self.on_save = on_save
+        self._listeners = []
+
+        # zapis wsadowy (patrz batch()): zmiany czekają tu do końca operacji
+        self._batch_depth = 0
+        self._dirty_tasks = {}     # Task -> None (zachowuje kolejność)
+        self._deleted_ids = []
+        self._dirty_series = {}    # Series -> None
+        self._bulk_ops = {}        # "done" / "all" -> None (kolejność wykonania)
+        self._events = False       # czy w tym bloku coś się zmieniło
+
+    def reserve_ids(self, next_id, next_series_id):
+        """Nowe id dopiero od podanych (np. największe id w bazie + 1)."""
+        self._next_id = max(self._next_id, next_id)
+        self._next_series_id = max(self._next_series_id, next_series_id)
+
+    # ================== Zdarzenia i zapis ==================
+    def subscribe(self, fn):
+        """fn(zdarzenie, zadanie) – patrz opis klasy."""
+        self._listeners.append(fn)
+
+    def _emit(self, event, task):
+        self._events = True
+        for fn in self._listeners:
+            fn(event, task)
+
+    @contextmanager
+    def batch(self):
+        """
+        Grupuje operacje: na końcu (najbardziej zewnętrznego bloku) jeden
+        on_save ze wszystkimi zmianami i jedno zdarzenie "committed".
+        Każda publiczna operacja sama jest takim blokiem.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+                if self._events:
+                    self._events = False
+                    for fn in self._listeners:
+                        fn("committed", None)
+
+    def _mark_dirty(self, task):
+        """Zadanie do zapisania: INSERT dla nowego, UPDATE dla istniejącego."""
+        if task.series is not None:
+            self._dirty_series[task.series] = None  # stan wystąpień siedzi w serii
+        else:
+            self._dirty_tasks[task] = None
+
+    def _mark_deleted(self, task):
+        if task.series is not None:
+            # usunięte wystąpienie = wyjątek w serii
+            task.series.exceptions.add(task.due)
+            self._dirty_series[task.series] = None
+            return
+        self._dirty_tasks.pop(task, None)
+        self._deleted_ids.append(task.db_id)
+
+    def pending_changes(self) -> dict:
+        """Zebrane (jeszcze nie oddane) zmiany w formacie on_save – i czyści je."""
+        changes = {("bulk", op): None for op in self._bulk_ops}
+        for t in self._dirty_tasks:
+            changes["tasks", t.db_id] = self.row_data(t)
+        for task_id in self._deleted_ids:
+            if task_id is not None:
+                changes["tasks", task_id] = None
+        for series in self._dirty_series:
+            changes["series", series.db_id] = series.to_data()
+        self._dirty_tasks = {}
+        self._deleted_ids = []
+        self._dirty_series = {}
+        self._bulk_ops = {}
+        return changes
+
+    def _flush(self):
+        changes = self.pending_changes()
+        if changes and self.on_save is not None:
+            self.on_save(changes)
+
+    @staticmethod
+    def row_data(task) -> dict:
+        """Dane jednego zadania w formacie db / JSON."""
+        return {
+            "id": task.db_id,
+            "text": task.get_text(),
+            "done": task.is_done(),
+            "cat": task.get_cat(),
+            "meta": task.get_meta(),
+            "star": task.get_starred(),
+            "created_seq": task.created_seq,
+            "rep": task.get_is_repeat(),
+            "time": task.get_time(),
+            "due_date": task.due.isoformat() if task.due else None,
+        }
+
+    # ================== Zapytania ==================
+    def items(self) -> list[Task]:
+        """Wszystkie zadania w kolejności wyświetlania (lista tylko do odczytu)."""
+        return self.tasks.items()
+
+    def on(self, day: date) -> list[Task]:
+        """Zadania na dany dzień w kolejności wyświetlania."""
+        return self.tasks.ordered(self.dates.on(day))
+
+    def query(self, mode="all", today=None) -> list[Task]:
+        """Zadania dla filtra: all | today | tomorrow."""
+        today = today or date.today()
+        if mode == "today":
+            return self.on(today)
+        if mode == "tomorrow":
+            return self.on(today + timedelta(days=1))
+        return self.items()
+
+    def __contains__(self, task) -> bool:
+        return task in self.tasks
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    # ================== Operacje na zadaniach ==================
+    def add(self, text, cat="Inne", meta=None, done=False, star=False, time=None, due=None,
+            created_seq=None, is_repeat=False, db_id=None):
+        """
+        Dodaje zadanie. Bez db_id to NOWE zadanie (dostaje id i idzie do zapisu);
+        z db_id – zadanie wczytane z bazy (bez zapisu).
+        """
+        with self.batch():
+            if created_seq is None:
+                created_seq = self._seq
+                self._seq += 1
+            is_new = db_id is None
+            if is_new:
+                db_id = self._next_id
+                self._next_id += 1
+
+            task = Task(
+                text, cat=cat, meta=meta, done=done, star=star,
+                created_seq=created_seq, is_repeat=is_repeat, db_id=db_id, due=due, time=time,
+            )
+            self._insert(task)
+            if is_new:
+                self._mark_dirty(task)  # nowe zadanie -> INSERT
+            return task
+
+    def _insert(self, task):
+        self.tasks.add(task)
+        self.dates.add(task)
+        self._emit("added", task)
+
+    def _drop(self, task):
+        """Wyjmuje zadanie z modelu (bez zapisu do bazy)."""
+        self.tasks.remove(task)
+        self.dates.remove(task)
+        if task.series is not None:
+            self._occurrences.pop((task.series.db_id, task.due), None)
+        self._emit("removed", task)
+
+    def delete(self, task):
+        """Usuwa zadanie; dla wystąpienia serii zapisuje wyjątek (ten dzień znika z serii)."""
+        if task not in self.tasks:
+            return
+        with self.batch():
+            self._drop(task)
+            self._mark_deleted(task)
+
+    def toggle(self, task, done: bool):
+        with self.batch():
+            task.set_done(done)
+            if task.series is not None:
+                task.series.set_done(task.due, done)
+            self._mark_dirty(task)
+            self._emit("changed", task)
+
+    def star(self, task, starred: bool):
+        with self.batch():
+            task.set_starred(starred)
+            self.tasks.reposition(task)  # gwiazdka zmienia miejsce na liście
+            if task.series is not None:
+                task.series.set_starred(task.due, starred)
+            self._mark_dirty(task)
+            self._emit("changed", task)
+
+    def _drop_many(self, tasks):
+        """Jak _drop() dla wielu zadań naraz – TaskOrder przebudowany jednym przejściem."""
+        self.tasks.remove_many(tasks)
+        for task in tasks:
+            self.dates.remove(task)
+            if task.series is not None:
+                self._occurrences.pop((task.series.db_id, task.due), None)
+            self._emit("removed", task)
+
+    def _bulk_deleted(self, tasks, op):
+        """
+        Zwykłe zadania usunięte hurtem: do bazy idzie jedno ("bulk", op).
+        Zadania z niezapisanymi jeszcze zmianami usuwamy dodatkowo po id –
+        baza może nie znać ich stanu (np. odhaczone w tej samej paczce).
+        """
+        for task in tasks:
+            if task in self._dirty_tasks:
+                del self._dirty_tasks[task]
+                self._deleted_ids.append(task.db_id)
+        self._bulk_ops[op] = None
+
+    def delete_done(self):
+        """Usuwa wszystkie odhaczone zadania (w bazie: db.delete_where(done=1))."""
+        with self.batch():
+            done = [t for t in self.tasks if t.is_done()]
+            if not done:
+                return
+            self._drop_many(done)
+            plain = []
+            for t in done:
+                if t.series is not None:
+                    self._mark_deleted(t)  # wystąpienie serii -> wyjątek w serii
+                else:
+                    plain.append(t)
+            if plain:
+                self._bulk_deleted(plain, "done")
+
+    def clear(self):
+        """Usuwa wszystko: serie i zadania (w bazie: db.delete_all())."""
+        with self.batch():
+            tasks = list(self.tasks)
+            self._drop_many(tasks)
+            self._occurrences.clear()
+            self.series.clear()
+            self._dirty_series = {}
+            self._bulk_deleted([t for t in tasks if t.series is None], "all")
+
+    # ================== Serie powtórzeń ==================
+    def window(self, today=None):
+        """Okno dat, dla którego rozwijamy wystąpienia serii: dziś + window_days - 1."""
+        today = today or date.today()
+        return today, today + timedelta(days=self.window_days - 1)
+
+    def add_series(self, text, cat, pattern, start: date, time=None) -> Series:
+        """Nowa seria (zapisana raz jako reguła, wystąpienia rozwijane na bieżąco)."""
+        with self.batch():
+            series = Series(
+                text, cat, pattern, start,
+                created_seq=self._seq, db_id=self._next_series_id, time=time,
+            )
+            self._seq += 1
+            self._next_series_id += 1
+            self.series[series.db_id] = series
+            self._dirty_series[series] = None
+            self._expand(series)
+            return series
+
+    def _expand(self, series, today=None):
+        """Tworzy (tylko brakujące) wystąpienia serii w oknie dat."""
+        first, last = self.window(today)
+        for d in series.dates_in(first, last):
+            key = (series.db_id, d)
+            if key in self._occurrences:
+                continue
+            task = Task(
+                series.text, cat=series.cat, meta=fmt_ddmm(d),
+                done=d in series.done, star=d in series.star,
+                created_seq=series.created_seq, is_repeat=d != series.start,
+                due=d, series=series, time=series.time,
+            )
+            self._occurrences[key] = task
+            self._insert(task)
+
+    def advance_window(self, today=None):
+        """Nowy dzień: wystąpienia sprzed dziś znikają, na końcu okna dochodzą nowe."""
+        first, _last = self.window(today)
+        with self.batch():
+            for task in list(self._occurrences.values()):
+                if task.due < first:
+                    self._drop(task)
+            for series in self.series.values():
+                if series.prune_before(first):
+                    self._dirty_series[series] = None
+                self._expand(series, first)
+
+    # ================== Wczytanie ==================
+    @timed("store.load")
+    def load(self, data: list[dict], series_data: list[dict] = (), imported=False, today=None):
+        """
+        Buduje model od nowa z wierszy db.load_all() / db.load_series().
+        imported=True (np. import z JSON-a): zadania z przeszłości są
+        pomijane, a reszta idzie do zapisu (w bazie jeszcze ich nie ma).
+        """
+        with self.batch():
+            for _loaded in self.load_iter(data, series_data, imported, today, chunk=len(data) or 1):
+                pass
+
+    def load_iter(self, data: list[dict], series_data: list[dict] = (), imported=False,
+                  today=None, chunk=500):
+        """
+        load() po kawałku – generator: po serii i po każdych `chunk` wierszach
+        oddaje liczbę przejrzanych wierszy data (każdy kawałek to osobny batch()).
+        Wiersze wczytują się w kolejności z data, więc to, co ma być widać
+        najpierw, wołający daje na początek.
+        Id i created_seq dla nowych zadań są ustalone od razu, więc między
+        kawałkami można normalnie dodawać i zmieniać zadania.
+        """
+        today = today or date.today()
+        with self.batch():
+            for task in list(self.tasks):
+                self._drop(task)
+            self.series.clear()
+            self._occurrences.clear()
+
+            seqs = [s for s in (item.get("created_seq") for item in chain(data, series_data))
+                    if isinstance(s, int)]
+            self._seq = max(seqs) + 1 if seqs else 0
+            if imported and data:
+                # backup JSON ma już id, ale w bazie tych wierszy nie ma
+                self._next_id = max(self._next_id, max(item.get("id") or 0 for item in data) + 1)
+
+            # serie: stare wyjątki precz, wystąpienia tylko dla okna dat (jest ich mało – od razu)
+            for item in series_data:
+                series = Series.from_data(item)
+                if series.prune_before(today) or imported:
+                    self._dirty_series[series] = None
+                self._next_series_id = max(self._next_series_id, series.db_id + 1)
+                self.series[series.db_id] = series
+                self._expand(series, today)
+        yield 0
+
+        # daty: wiersze z bazy mają gotowe due_date, meta parsujemy tylko dla JSON-a
+        parsed = iter(metas_to_dates(item.get("meta") for item in data if "due_date" not in item))
+        for start in range(0, len(data), chunk):
+            with self.batch():
+                for item in data[start:start + chunk]:
+                    self._load_row(item, parsed, today, imported)
+            yield min(start + chunk, len(data))
+
+    def _load_row(self, item, parsed, today, imported):
+        if "due_date" in item:
+            d = date.fromisoformat(item["due_date"]) if item["due_date"] else None
+        else:
+            d = next(parsed)
+        # z przeszłości – pomijamy (baza czyści je sama: db.purge_before)
+        if d is not None and d < today:
+            return
+        task = self.add(
+            item.get("text", ""),
+            done=bool(item.get("done", False)),
+            cat=item.get("cat", "Inne"),
+            meta=item.get("meta"),
+            star=bool(item.get("star", False)),
+            created_seq=item.get("created_seq"),
+            is_repeat=bool(item.get("rep", False)),
+            db_id=item.get("id"),
+            due=d,
+            time=item.get("time"),
+        )
+        if imported:
+            self._mark_dirty(task)
@@ -0,0 +1,75 @@
+# styles.py
+
+import tkinter as tk
+
+from config import THEMES, DEFAULT_THEME
+
+# Wspólne kolory aplikacji – to samo, co fonts.py robi dla rozmiarów.
+# palette() to JEDEN słownik kolorów (self.c w aplikacji, wierszach i liście).
+# Zmiana motywu podmienia w nim wartości, a widgety zapisane przez bind()
+# i funkcje z subscribe() dostają nowe kolory w miejscu – bez przebudowy UI.
+
+_theme = DEFAULT_THEME
+_palette = dict(THEMES[DEFAULT_THEME])
+_bindings = []   # (widget, {opcja: klucz palety})
+_listeners = []  # fn() po zmianie motywu (np. listy zadań przerysowują wiersze)
+
+
+def palette() -> dict:
+    """Wspólna paleta bieżącego motywu (ten sam słownik przez cały czas działania)."""
+    return _palette
+
+
+def theme() -> str:
+    return _theme
+
+
+def bind(widget, **options):
+    """
+    bind(label, bg="CARD", fg="TEXT") – opcje widgetu z palety: ustawia je
+    od razu i po każdej zmianie motywu. Zwraca widget (da się pisać w jednej linii).
+    """
+    widget.configure(**{option: _palette[key] for option, key in options.items()})
+    _bindings.append((widget, options))
+    return widget
+
+
+def subscribe(fn):
+    """fn() – wołane po zmianie motywu (dla tego, czego nie da się zapisać przez bind())."""
+    _listeners.append(fn)
+
+
+def use_theme(name: str):
+    """Przełącza motyw: nowe kolory w palecie, zapisane widgety przestylowane w miejscu."""
+    global _theme
+    if name == _theme:
+        return
+    _theme = name
+    _palette.update(THEMES[name])
+    alive = []
+    for widget, options in _bindings:
+        try:
+            widget.configure(**{option: _palette[key] for option, key in options.items()})
+        except tk.TclError:
+            continue  # widget już zniszczony – zapominamy go
+        alive.append((widget, options))
+    _bindings[:] = alive
+    for fn in _listeners:
+        fn()
+
+
+def button(btn, primary=True, font=None):
+    """Styl przycisku (główny / zwykły); kolory – także po najechaniu – idą za motywem."""
+    if primary:
+        bg, hover = "ACCENT", "ACCENT_HOVER"
+        btn.configure(fg="white", activeforeground="white")
+        bind(btn, bg=bg, activebackground=hover)
+    else:
+        bg, hover = "CARD", "CARD_2"
+        bind(btn, bg=bg, activebackground=hover, fg="TEXT", activeforeground="TEXT")
+    btn.configure(
+        relief="flat", bd=0, padx=14, pady=8, cursor="hand2",
+        font=font or ("Segoe UI", 10, "bold"),
+    )
+    btn.bind("<Enter>", lambda _e: btn.configure(bg=_palette[hover]))
+    btn.bind("<Leave>", lambda _e: btn.configure(bg=_palette[bg]))
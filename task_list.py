@@ -0,0 +1,194 @@
+# task_list.py
+
+import styles
+from instrument import timed
+from task_row import TaskRow
+
+# odstępy między wierszami (jak dawne pack(pady=5, padx=8))
+ROW_GAP = 10
+ROW_PADX = 8
+
+
+class TaskListBase:
+    """
+    Wspólna część list zadań na Canvasie: przewijanie, scrollregion
+    i wybór widocznego zakresu. Rysujemy tylko widoczne wiersze – pula
+    "slotów" (ile mieści się na ekranie + zapas) dostaje przy przewijaniu
+    kolejne zadania, a scrollregion to liczba zadań * wysokość wiersza.
+
+    Podklasy decydują, czym jest slot (VirtualTaskList: TaskRow w oknie
+    canvasa, CanvasTaskList: elementy narysowane na canvasie):
+      _add_slot()                – nowy, schowany slot na końcu self._slots,
+      _show_slot(i, idx)         – slot i pokazuje zadanie self.items[idx],
+      _hide_slot(i)              – chowa slot i,
+      _measure_row(sample)       – ustawia self._row_h (wspólna wysokość wiersza).
+    Ostatni element slotu to to, co w nim pokazano (None = schowany).
+    """
+
+    def __init__(self, canvas, scrollbar, c, s):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.c = c
+        self.s = s
+        self.items = []          # zadania w kolejności wyświetlania
+        self._slots = []         # [..., co pokazano albo None]
+        self._row_h = None       # wysokość wiersza (mierzona przy pierwszym rysowaniu)
+        self._width = 1
+        self._render_pending = False
+
+        canvas.configure(yscrollcommand=self._on_yscroll)
+        scrollbar.configure(command=canvas.yview)
+        canvas.bind("<Configure>", self._on_configure)
+        styles.subscribe(self._on_theme)
+
+    # ---------- API ----------
+    def set_items(self, items):
+        """Ustawia listę zadań do wyświetlenia i przerysowuje widoczne wiersze."""
+        self.items = items
+        self.update_scrollregion()
+        self.render()
+
+    @timed("list.update_scrollregion")
+    def update_scrollregion(self):
+        row_h = self._row_h or 1
+        height = max(len(self.items) * row_h, self.canvas.winfo_height())
+        self.canvas.configure(scrollregion=(0, 0, self._width, height))
+
+    @timed("list.render")
+    def render(self):
+        """Podpina zadania z widocznego zakresu do slotów (ruszając tylko te, które się zmieniły)."""
+        self._render_pending = False
+        n = len(self.items)
+        if n and self._row_h is None:
+            self._measure_row(self.items[0])
+            self.update_scrollregion()
+        row_h = self._row_h or 1
+
+        view_h = max(self.canvas.winfo_height(), 1)
+        first = max(0, int(self.canvas.canvasy(0) // row_h))
+        count = max(0, min(n - first, view_h // row_h + 2))
+        while len(self._slots) < count:
+            self._add_slot()
+
+        for i, slot in enumerate(self._slots):
+            if i < count:
+                self._show_slot(i, first + i)
+            elif slot[-1] is not None:
+                self._hide_slot(i)
+
+    def set_sizes(self, s):
+        """Zmiana zoomu: sloty zostają, tylko mierzymy wiersz na nowo."""
+        self.s = s
+        self._row_h = None
+        self._reset_slots()  # nowa wysokość = nowe pozycje
+        self.update_scrollregion()
+        self.render()
+
+    def _on_theme(self):
+        """Nowy motyw: sloty zostają, tylko rysujemy je od nowa (nowe tła)."""
+        self._reset_slots()
+        self.render()
+
+    def schedule_render(self):
+        """Przerysowanie przy najbliższej okazji (kilka zdarzeń -> jedno rysowanie)."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self.render)
+
+    def _reset_slots(self):
+        """Chowa wszystkie sloty – render() rozstawi je od nowa."""
+        for i in range(len(self._slots)):
+            self._hide_slot(i)
+
+    def _row_width(self):
+        return max(self._width - 2 * ROW_PADX, 1)
+
+    # ---------- zdarzenia ----------
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.schedule_render()
+
+    def _on_configure(self, event):
+        if event.width != self._width:
+            self._width = event.width
+            self._on_width()
+        self.update_scrollregion()
+        self.schedule_render()
+
+    def _on_width(self):
+        """Zmieniła się szerokość listy (podklasy dopasowują do niej sloty)."""
+
+
+class VirtualTaskList(TaskListBase):
+    """
+    Wirtualizowana lista zadań z widgetów: slot to TaskRow w oknie canvasa.
+    Przy przewijaniu te same TaskRow dostają inne zadania (bind_task),
+    bez tworzenia nowych widgetów.
+    """
+
+    def __init__(self, canvas, scrollbar, c, s, on_change, on_star_toggle, on_delete, wheel_handler=None,
+                 animator=None):
+        super().__init__(canvas, scrollbar, c, s)
+        self._row_kwargs = dict(
+            on_change=on_change, c=c, s=s,
+            on_delete=on_delete, on_star_toggle=on_star_toggle, animator=animator,
+        )
+        self._wheel_handler = wheel_handler
+        # self._slots: [[TaskRow, id okna na canvasie, indeks na liście albo None]]
+
+    def set_sizes(self, s):
+        self._row_kwargs["s"] = s
+        for slot in self._slots:
+            slot[0].set_sizes(s)
+        super().set_sizes(s)
+
+    # ---------- sloty ----------
+    def _add_slot(self):
+        row = TaskRow(self.canvas, **self._row_kwargs)
+        win = self.canvas.create_window(
+            ROW_PADX, 0, window=row.frame, anchor="nw",
+            width=self._row_width(), height=(self._row_h or ROW_GAP + 1) - ROW_GAP,
+            state="hidden",
+        )
+        if self._wheel_handler:
+            self._bind_wheel(row.frame)
+        self._slots.append([row, win, None])
+        return row, win
+
+    def _show_slot(self, i, idx):
+        slot = self._slots[i]
+        row, win, old_idx = slot
+        color = self.c["CARD"] if idx % 2 else self.c["CARD_2"]
+        row.bind_task(self.items[idx], color)  # sam pomija, jeśli nic się nie zmieniło
+        if idx != old_idx:
+            self.canvas.coords(win, ROW_PADX, idx * self._row_h + ROW_GAP // 2)
+            if old_idx is None:
+                self.canvas.itemconfigure(win, state="normal")
+            slot[2] = idx
+
+    def _hide_slot(self, i):
+        slot = self._slots[i]
+        slot[0].unbind_task()
+        self.canvas.itemconfigure(slot[1], state="hidden")
+        slot[2] = None
+
+    def _measure_row(self, sample):
+        """Mierzy wysokość wiersza na pierwszym zadaniu (wszystkie wiersze mają ją wspólną)."""
+        row, win = self._slots[0][:2] if self._slots else self._add_slot()
+        row.bind_task(sample)
+        row.label.configure(text="Ag")  # jedna linia tekstu, niezależnie od treści zadania
+        row.frame.update_idletasks()
+        self._row_h = row.frame.winfo_reqheight() + ROW_GAP
+        for _row, w, _idx in self._slots:
+            self.canvas.itemconfigure(w, height=self._row_h - ROW_GAP)
+        self._reset_slots()
+
+    def _on_width(self):
+        for _row, win, _idx in self._slots:
+            self.canvas.itemconfigure(win, width=self._row_width())
+
+    def _bind_wheel(self, widget):
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(seq, self._wheel_handler)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
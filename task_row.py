@@ -1,260 +1,275 @@
 
 # task_row.py
 
+import random
 import tkinter as tk
-import tkinter.font as tkfont
+import fonts
+import styles
+from instrument import timed
 from config import category_color
+from animations import Blink
 
 STAR_OFF = "☆"  # szara
 STAR_ON  = "★"  # żółta
+ANIM_TEXTS = ("✨ Dobrze!", "🌟 Super!", "✅ Gotowe!", "⭐ Brawo!")
 
 class TaskRow:
+    """
+    Widok JEDNEGO wiersza listy. Wiersze są wielokrotnego użytku:
+    lista (VirtualTaskList) trzyma tylko tyle TaskRow, ile mieści się na ekranie,
+    i przez bind_task() podpina do nich kolejne zadania (model.Task) przy przewijaniu.
+    Kliknięcia idą do aplikacji jako callbacki z zadaniem:
+      on_change(task, done), on_star_toggle(task, starred), on_delete(task)
+    Animację po odhaczeniu prowadzi wspólny zegar (animations.AnimationTicker).
+    """
+
+    @timed("row.create")
     def __init__(
         self,
         master,
-        text,
-        cat,
         on_change,
         c,
         s,
-        row_color=None,
         on_delete=None,
-        meta=None,
         on_star_toggle=None,
-        star=False,
-        is_repeat=False,
+        animator=None,
     ):
         self.master = master
-        self.text = str(text)
-        self.cat = str(cat or "Inne")
         self.on_change = on_change
         self.on_delete = on_delete
         self.on_star_toggle = on_star_toggle
+        self.animator = animator          # AnimationTicker albo None (bez animacji)
         self.c = c
         self.s = s
-        self.meta = meta                  # 'dd.mm' lub None
-        self._starred = bool(star)        # stan gwiazdki
-        self._is_repeat = bool(is_repeat) # czy to element serii powtórzeń
+        self.task = None                  # aktualnie wyświetlane zadanie
+        self._shown = None                # co ostatnio narysowano (żeby nie konfigurować bez zmian)
+        self._text_w = None               # px na tekst zadania (z <Configure> etykiety)
         self.var = tk.BooleanVar(value=False)
-        self.row_bg = row_color or c["CARD"]
+        self.row_bg = c["CARD"]
         self.anim_label = None
 
         # flaga czy widget już zniszczony
         self._destroyed = False
 
-        # Wiersz (NAJWAŻNIEJSZA ZMIANA: nie pakujemy go od razu)
-        self.frame = tk.Frame(
-            master, bg=self.row_bg,
-            highlightbackground=c["BORDER"], highlightcolor=c["BORDER"], highlightthickness=2
-        )
-        self._pack_opts = dict(fill="x", pady=5, padx=8)
+        # Wiersz (pozycję na liście ustawia VirtualTaskList)
+        # kolory niezależne od zadania idą za motywem same (styles.bind);
+        # tło wiersza i kolor tekstu ustawia bind_task()
+        self.frame = tk.Frame(master, bg=self.row_bg, highlightthickness=2)
+        styles.bind(self.frame, highlightbackground="BORDER", highlightcolor="BORDER")
 
         # Lewa część: checkbox + tekst
-        main = tk.Frame(self.frame, bg=self.row_bg)
-        main.pack(side="left", fill="x", expand=True, pady=8, padx=8)
+        self.main = tk.Frame(self.frame, bg=self.row_bg)
+        self.main.pack(side="left", fill="x", expand=True, pady=8, padx=8)
 
         self.chk = tk.Checkbutton(
-            main, variable=self.var, command=self._toggle,
-            bg=self.row_bg, activebackground=self.row_bg, fg=self.c["TEXT"],
-            selectcolor=self.c["CARD_2"], highlightthickness=0, cursor="hand2"
+            self.main, variable=self.var, command=self._toggle,
+            bg=self.row_bg, activebackground=self.row_bg, highlightthickness=0, cursor="hand2"
         )
+        styles.bind(self.chk, fg="TEXT", selectcolor="CARD_2")
         self.chk.grid(row=0, column=0, padx=(0, 8), sticky="nw")
 
-        self.font_normal = tkfont.Font(family="Segoe UI", size=self.s["task"], weight="bold")
-        self.font_done = tkfont.Font(family="Segoe UI", size=self.s["task"], weight="bold")
-        self.font_done.configure(overstrike=1)
+        # fonty są wspólne dla wszystkich wierszy (fonts.py) – zoom zmienia je w miejscu
+        self.font_normal = fonts.get("task")
+        self.font_done = fonts.get("task_done")
 
+        # width=1: etykieta nie żąda miejsca na cały tekst, tylko bierze to, co zostaje
+        # obok prawej części wiersza – a tekst przycinamy do tej szerokości (_fit_text)
         self.label = tk.Label(
-            main, text=self.text, font=self.font_normal,
+            self.main, text="", font=self.font_normal, width=1, padx=0, bd=0,
             bg=self.row_bg, fg=self.c["TEXT"], anchor="w",
-            wraplength=self.s["wrap"], justify="left"
         )
-        self.label.grid(row=0, column=1, sticky="w")
+        self.label.grid(row=0, column=1, sticky="we")
+        self.main.grid_columnconfigure(1, weight=1)
+        self.label.bind("<Configure>", self._on_label_resize)
 
         # Prawa część: ⭐ → badge → Usuń → data
-        right = tk.Frame(self.frame, bg=self.row_bg)
-        right.pack(side="right", padx=8)
+        self.right = tk.Frame(self.frame, bg=self.row_bg)
+        self.right.pack(side="right", padx=8)
 
         # ⭐
         self.star_btn = tk.Button(
-            right,
-            text=STAR_ON if self._starred else STAR_OFF,
+            self.right,
+            text=STAR_OFF,
             bd=0, padx=6, pady=2, cursor="hand2",
             bg=self.row_bg,
-            fg=("#FFD54F" if self._starred else "#A0A0A0"),
+            fg="#A0A0A0",
             activebackground=self.row_bg,
-            activeforeground=("#FFD54F" if self._starred else "#A0A0A0"),
-            font=("Segoe UI", max(self.s["button"], 10), "bold"),
+            activeforeground="#A0A0A0",
+            font=fonts.get("star"),
             command=self._toggle_star
         )
         self.star_btn.pack(side="left", padx=(0, 8))
 
         # badge kategorii
         self.badge = tk.Label(
-            right, text=self.cat,
+            self.right, text="",
             bg="#0E0E10", fg="white",
-            font=("Segoe UI", self.s["button"], "bold"),
+            font=fonts.get("button"),
             padx=12, pady=4, cursor="arrow",
-            highlightthickness=2, highlightbackground=category_color(self.cat)
+            highlightthickness=2, highlightbackground=category_color("Inne")
         )
         self.badge.pack(side="left", padx=(0, 8))
 
         # Usuń
         self.btn_del = tk.Button(
-            right, text="Usuń", command=self.destroy,
-            bg=self.c["CARD_2"], fg=self.c["TEXT"], bd=0, padx=10, pady=6, cursor="hand2",
-            activebackground=self.c["CARD_2"], activeforeground=self.c["TEXT"]
+            self.right, text="Usuń", command=self._delete, bd=0, padx=10, pady=6, cursor="hand2",
         )
+        styles.bind(self.btn_del, bg="CARD_2", fg="TEXT", activebackground="CARD_2", activeforeground="TEXT")
         self.btn_del.bind("<Enter>", lambda _e: self.btn_del.configure(bg=self.c["CARD"]))
         self.btn_del.bind("<Leave>", lambda _e: self.btn_del.configure(bg=self.c["CARD_2"]))
         self.btn_del.pack(side="left", padx=(0, 8))
 
         # Data
         self.date_label = tk.Label(
-            right,
-            text=(self.meta or ""),
+            self.right,
+            text="",
             bg=self.row_bg,
-            fg=self.c["MUTED"],
-            font=("Segoe UI", max(self.s["button"] - 1, 8))
+            font=fonts.get("date")
         )
-        if self.meta:
-            self.date_label.pack(side="left", padx=(0, 0))
+        styles.bind(self.date_label, fg="MUTED")
 
-    # Widoczność (dla filtrów)
-    def show(self):
-        # nie próbuj pakować jeśli już zniszczone albo nie istnieje
-        if self._destroyed:
-            return
-        if not self.frame.winfo_exists():
-            return
-        if not self.frame.winfo_ismapped():
-            # TERAZ dopiero pakujemy pierwszy raz
-            self.frame.pack(**self._pack_opts)
+    def set_sizes(self, s):
+        """Nowe rozmiary z sizes(zoomed); fonty zmieniają się same, tekst przytnie następne bind_task()."""
+        self.s = s
+        self._shown = None
 
-    def hide(self):
+    # Podpięcie zadania (przy przewijaniu ten sam wiersz pokazuje inne zadania)
+    @timed("row.bind_task")
+    def bind_task(self, task, row_color=None):
         if self._destroyed:
             return
-        if not self.frame.winfo_exists():
-            return
-        if self.frame.winfo_ismapped():
-            self.frame.pack_forget()
+        row_color = row_color or self.c["CARD"]
+        shown = (
+            task.get_text(), task.get_cat(), task.get_starred(),
+            task.get_meta(), task.get_time(), task.is_done(), row_color,
+        )
+        if task is self.task and shown == self._shown:
+            return  # nic się nie zmieniło – żadnych configure
+        if task is not self.task:
+            self._stop_animation()
+        self.task = task
+        self._shown = shown
+        if row_color != self.row_bg:
+            self._set_row_bg(row_color)
+
+        self._fit_text()
+        cat = task.get_cat()
+        self.badge.configure(text=cat, highlightbackground=category_color(cat))
+        self._show_star(task.get_starred())
+        self._show_meta(task.get_meta(), task.get_time())
+        self.var.set(task.is_done())
+        self._show_done(task.is_done())
+
+    def _fit_text(self):
+        """
+        Wiersz ma stałą wysokość (VirtualTaskList) – tekst w jednej linii,
+        za długi przycięty z "…" do bieżącej szerokości etykiety (przed
+        pierwszym <Configure> – do s["wrap"]).
+        """
+        font = self.font_done if self.task.is_done() else self.font_normal
+        self.label.configure(text=fonts.fit(self.task.get_text(), font, self._text_w or self.s["wrap"]))
+
+    def _on_label_resize(self, event):
+        # zmiana szerokości okna albo prawej części wiersza (badge, data)
+        if event.width != self._text_w:
+            self._text_w = event.width
+            if self.task is not None:
+                self._fit_text()
+
+    def unbind_task(self):
+        self._stop_animation()
+        self.task = None
+        self._shown = None
+
+    def _set_row_bg(self, color):
+        self.row_bg = color
+        for w in (self.frame, self.main, self.right, self.label, self.date_label):
+            w.configure(bg=color)
+        self.chk.configure(bg=color, activebackground=color)
+        self.star_btn.configure(bg=color, activebackground=color)
+        if self.anim_label:
+            self.anim_label.configure(bg=color)
 
-    def set_visible(self, visible: bool):
-        (self.show() if visible else self.hide())
+    def _show_star(self, starred: bool):
+        self.star_btn.configure(
+            text=(STAR_ON if starred else STAR_OFF),
+            fg=("#FFD54F" if starred else "#A0A0A0"),
+            activeforeground=("#FFD54F" if starred else "#A0A0A0"),
+        )
 
-    # Animacja po odhaczeniu
+    def _show_meta(self, meta, time=None):
+        if meta:
+            self.date_label.configure(text=f"{meta} {time}" if time else meta)
+            if not self.date_label.winfo_manager():
+                self.date_label.pack(side="left", padx=(0, 0))
+        else:
+            if self.date_label.winfo_manager():
+                self.date_label.pack_forget()
+
+    def _show_done(self, done: bool):
+        if done:
+            self.label.configure(font=self.font_done, fg=self.c["MUTED"])
+            self.badge.configure(bg="#151515", fg="#D0D0D0")
+        else:
+            self.label.configure(font=self.font_normal, fg=self.c["TEXT"])
+            self.badge.configure(bg="#0E0E10", fg="white")
+
+    # Animacja po odhaczeniu: jeden label na wiersz (tworzony raz), mruga wspólny zegar
     def _show_animation(self):
-        if self._destroyed:
+        if self._destroyed or self.animator is None:
             return
-        if self.anim_label:
-            self.anim_label.destroy()
-        anim_texts = ["✨ Dobrze!", "🌟 Super!", "✅ Gotowe!", "⭐ Brawo!"]
-        import random
-        text = random.choice(anim_texts)
-        self.anim_label = tk.Label(
-            self.frame, text=text, fg=self.c["ACCENT"],
-            bg=self.row_bg, font=("Segoe UI", self.s["task"], "bold")
-        )
+        self._stop_animation()  # poprzednie mruganie tego wiersza (chowa label)
+        if self.anim_label is None:
+            self.anim_label = tk.Label(self.frame, font=self.font_normal)
+        self.anim_label.configure(text=random.choice(ANIM_TEXTS), fg=self.c["ACCENT"], bg=self.row_bg)
         self.anim_label.pack(side="right", padx=10)
+        self.animator.start(self, Blink(
+            self.anim_label, lambda: (self.c["ACCENT"], self.c["TEXT"]),
+            on_done=self._hide_animation,
+        ))
+
+    def _stop_animation(self):
+        if self.animator is not None:
+            self.animator.cancel(self)  # sam zawoła _hide_animation
 
-        def blink(times=6):
-            if self._destroyed or not self.anim_label:
-                return
-            if times <= 0:
-                self.anim_label.destroy(); self.anim_label = None; return
-            current = self.anim_label.cget("fg")
-            new_color = self.c["TEXT"] if current == self.c["ACCENT"] else self.c["ACCENT"]
-            self.anim_label.configure(fg=new_color)
-            self.frame.after(120, blink, times - 1)
-        blink()
+    def _hide_animation(self):
+        if self.anim_label is not None and not self._destroyed:
+            self.anim_label.pack_forget()
 
     def _toggle(self):
         # kliknięcie checkboxa
-        if self.var.get():
-            self.label.configure(font=self.font_done, fg=self.c["MUTED"])
-            self.badge.configure(bg="#151515", fg="#D0D0D0")
+        if self.task is None:
+            return
+        done = bool(self.var.get())
+        self._show_done(done)
+        self._shown = None
+        if done:
             self._show_animation()
         else:
-            self.label.configure(font=self.font_normal, fg=self.c["TEXT"])
-            self.badge.configure(bg="#0E0E10", fg="white")
-            if self.anim_label:
-                self.anim_label.destroy(); self.anim_label = None
+            self._stop_animation()
         if self.on_change:
-            self.on_change()
+            self.on_change(self.task, done)
 
     # ⭐ logika
     def _toggle_star(self):
-        self._starred = not self._starred
-        self.star_btn.configure(
-            text=(STAR_ON if self._starred else STAR_OFF),
-            fg=("#FFD54F" if self._starred else "#A0A0A0"),
-            activeforeground=("#FFD54F" if self._starred else "#A0A0A0"),
-        )
-        if self.on_star_toggle:
-            self.on_star_toggle(self, self._starred)
-
-    def get_starred(self) -> bool:
-        return self._starred
-
-    def get_is_repeat(self) -> bool:
-        return self._is_repeat
-
-    # Akcesory
-    def is_done(self) -> bool:
-        return bool(self.var.get())
-
-    def get_text(self) -> str:
-        return self.text
-
-    def get_cat(self) -> str:
-        return self.cat
-
-    def get_meta(self):
-        return self.meta
-
-    def set_meta(self, meta: str | None):
-        self.meta = meta
-        if self._destroyed or not self.frame.winfo_exists():
+        if self.task is None:
             return
-        if self.meta:
-            self.date_label.configure(text=self.meta)
-            if not self.date_label.winfo_ismapped():
-                self.date_label.pack(side="left", padx=(0, 0))
-        else:
-            if self.date_label.winfo_ismapped():
-                self.date_label.pack_forget()
+        starred = not self.task.get_starred()
+        self._show_star(starred)
+        self._shown = None
+        if self.on_star_toggle:
+            self.on_star_toggle(self.task, starred)
 
-    def set_done(self, value: bool, silent: bool = False):
-        """Ustawia stan przy odtwarzaniu z pliku itp.
-        silent=True = bez animacji."""
-        self.var.set(bool(value))
-        if bool(value):
-            self.label.configure(font=self.font_done, fg=self.c["MUTED"])
-            self.badge.configure(bg="#151515", fg="#D0D0D0")
-            if not silent:
-                self._show_animation()
-        else:
-            self.label.configure(font=self.font_normal, fg=self.c["TEXT"])
-            self.badge.configure(bg="#0E0E10", fg="white")
-            if self.anim_label:
-                self.anim_label.destroy(); self.anim_label = None
-        if self.on_change:
-            self.on_change()
+    def _delete(self):
+        """Kliknięcie "Usuń" – aplikacja usuwa zadanie i przerysowuje listę."""
+        if self.task is not None and self.on_delete:
+            self.on_delete(self.task)
 
     def destroy(self):
-        """Usuń wiersz poprawnie i daj znać aplikacji."""
+        """Usuń widgety wiersza (np. przy przebudowie UI)."""
         if self._destroyed:
             return
+        self._stop_animation()
         self._destroyed = True
-
-        # powiedz aplikacji żeby wyrzuciła mnie z listy
-        if self.on_delete:
-            self.on_delete(self)
-
-        # spróbuj zniszczyć UI
-        try:
-            self.frame.destroy()
-        finally:
-            # zapisz zmiany po usunięciu
-            if self.on_change:
-                self.on_change()
+        self.task = None
+        self.frame.destroy()
@@ -0,0 +1,27 @@
+# tests/conftest.py
+#
+# Testy bez ekranu (python -m pytest): baza i pliki w katalogu tymczasowym,
+# NIE w prawdziwym folderze użytkownika – MAJA_DATA_DIR musi być ustawione
+# przed importem config / db.
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("MAJA_DATA_DIR", tempfile.mkdtemp(prefix="maja-tests-"))
+os.environ.setdefault("MAJA_NOTIFY", "null")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest  # noqa: E402
+
+import db  # noqa: E402
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    """Osobny plik bazy na test (połączenie wątku zamykane na końcu)."""
+    db.close_connection()
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "test.db"))
+    yield db
+    db.close_connection()
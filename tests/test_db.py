@@ -0,0 +1,55 @@
+# tests/test_db.py
+
+import sqlite3
+
+import pytest
+
+import db
+
+
+def _columns(conn, table):
+    return {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def test_init_db_fresh_then_up_to_date(fresh_db):
+    assert db.init_db() is True
+    conn = db._get_connection()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+    assert {"time", "due_date"} <= _columns(conn, "tasks")
+    assert db.init_db() is False
+
+
+def test_failed_migration_rolls_back_with_its_version(fresh_db, monkeypatch):
+    """Awaria w środku migracji: ani ALTER TABLE, ani nowe user_version nie zostają."""
+    def broken_due_date(conn):
+        db._add_column(conn, "tasks", "due_date", "TEXT")
+        raise RuntimeError("awaria w trakcie migracji")
+
+    migrations = db._MIGRATIONS[:-1] + (broken_due_date,)
+    monkeypatch.setattr(db, "_MIGRATIONS", migrations)
+    with pytest.raises(RuntimeError):
+        db.init_db()
+
+    conn = db._get_connection()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == len(migrations) - 1
+    assert "due_date" not in _columns(conn, "tasks")
+
+    # następny start: prawdziwa migracja przechodzi (bez "duplicate column")
+    monkeypatch.undo()
+    db.init_db()
+    assert "due_date" in _columns(db._get_connection(), "tasks")
+
+
+def test_migrates_old_schema_without_version(fresh_db):
+    """Baza sprzed migracji (user_version = 0, tabela tasks bez nowych kolumn)."""
+    conn = sqlite3.connect(db.DB_NAME)
+    conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, text TEXT NOT NULL, done INTEGER, "
+                 "cat TEXT, meta TEXT, star INTEGER, created_seq INTEGER, rep INTEGER)")
+    conn.execute("INSERT INTO tasks (text, meta) VALUES ('stare', '01.02')")
+    conn.commit()
+    conn.close()
+
+    assert db.init_db() is False
+    (row,) = db.load_all()
+    assert row["text"] == "stare"
+    assert row["due_date"].endswith("-02-01")
@@ -0,0 +1,144 @@
+# tests/test_saver.py
+#
+# Zapis w tle z tą samą ścieżką co w aplikacji: TaskStore -> TodoApp._submit_changes
+# -> WriteBehindSaver -> TodoApp._write_changes -> SQLite. Bez Tk: obiekt
+# aplikacji ma tylko pola, których te metody potrzebują.
+
+import sqlite3
+import time
+from datetime import date
+
+import pytest
+
+import db
+from app import TodoApp
+from saver import WriteBehindSaver
+from store import TaskStore
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def app(fresh_db):
+    db.init_db()
+    app = object.__new__(TodoApp)
+    app._changed_since_backup = False
+    app._save_error = None
+    # długie okno: wszystko poniżej dzieje się w JEDNYM oknie debounce
+    app._saver = WriteBehindSaver(
+        app._write_changes, window_ms=2000, on_stop=db.close_connection,
+        on_error=app._on_save_error, retry_ms=100,
+    )
+    app.store = TaskStore(next_id=db.max_task_id() + 1, on_save=app._submit_changes)
+    yield app
+    app._saver.close()
+
+
+def _add(store, text):
+    return store.add(text, meta=TODAY.strftime("%d.%m"), due=TODAY)
+
+
+def _saved(app):
+    assert app._saver.flush(timeout=5)
+    return {row["text"]: row["done"] for row in db.load_all()}
+
+
+def test_toggle_remove_done_add_in_one_window(app):
+    store = app.store
+    a = _add(store, "a")
+    _add(store, "b")
+    assert _saved(app) == {"a": False, "b": False}
+
+    store.toggle(a, True)   # zmiana czeka w oknie debounce...
+    store.delete_done()     # ...DELETE ... WHERE done=1 musi pójść po niej
+    _add(store, "c")        # ...a nowe zadanie po DELETE
+
+    assert _saved(app) == {"b": False, "c": False}
+
+
+def test_unsaved_done_task_is_removed(app):
+    store = app.store
+    with store.batch():
+        d = _add(store, "d")
+        store.toggle(d, True)
+        store.delete_done()   # d jeszcze nie ma w bazie – idzie usunięcie po id
+        _add(store, "e")
+    f = _add(store, "f")
+    store.toggle(f, True)
+    store.delete_done()
+
+    assert _saved(app) == {"e": False}
+
+
+def test_clear_then_add_in_one_window(app):
+    store = app.store
+    for text in "xyz":
+        _add(store, text)
+    store.add_series("trening", "Sport", "Codziennie", TODAY)
+    store.clear()
+    _add(store, "po czyszczeniu")
+
+    assert _saved(app) == {"po czyszczeniu": False}
+    assert db.load_series() == []
+
+
+# ---------- nieudany zapis ----------
+@pytest.fixture
+def broken_db(monkeypatch):
+    """broken_db[0] = True -> każdy zapis do bazy rzuca wyjątek."""
+    broken = [False]
+    write_batch = db.write_batch
+
+    def flaky(*args):
+        if broken[0]:
+            raise sqlite3.OperationalError("database is locked")
+        write_batch(*args)
+
+    monkeypatch.setattr(db, "write_batch", flaky)
+    return broken
+
+
+def test_failed_write_is_retried_with_next_change(app, broken_db):
+    store = app.store
+    a = _add(store, "a")
+    _add(store, "b")
+    assert _saved(app) == {"a": False, "b": False}
+
+    broken_db[0] = True
+    store.delete(a)
+    assert _saved(app) == {"a": False, "b": False}
+    assert isinstance(app._save_error, sqlite3.OperationalError)
+
+    broken_db[0] = False
+    _add(store, "c")  # dowolna kolejna zmiana zabiera też zaległe usunięcie a
+    assert _saved(app) == {"b": False, "c": False}
+    assert app._save_error is None
+
+
+def test_failed_write_is_retried_without_new_changes(app, broken_db):
+    store = app.store
+    broken_db[0] = True
+    _add(store, "a")
+    assert _saved(app) == {}
+
+    broken_db[0] = False
+    deadline = time.monotonic() + 5
+    while app._save_error is not None and time.monotonic() < deadline:
+        time.sleep(0.02)  # saver sam ponawia po retry_ms
+    assert _saved(app) == {"a": False}
+
+
+def test_bulk_delete_waits_for_failed_write(app, broken_db):
+    store = app.store
+    a = _add(store, "a")
+    b = _add(store, "b")
+    assert _saved(app) == {"a": False, "b": False}
+
+    broken_db[0] = True
+    store.toggle(a, True)   # nie zapisze się...
+    store.delete_done()     # ...więc DELETE ... WHERE done=1 musi na nie poczekać
+    store.toggle(b, True)   # b zrobione PO usunięciu – musi zostać w bazie
+    assert _saved(app) == {"a": False, "b": False}
+
+    broken_db[0] = False
+    assert _saved(app) == {"b": True}
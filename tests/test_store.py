@@ -0,0 +1,213 @@
+# tests/test_store.py
+
+from datetime import date, timedelta
+
+import pytest
+
+from powtarzanie import fmt_ddmm
+from store import TaskStore
+
+TODAY = date(2026, 3, 2)  # poniedziałek
+
+
+class Recorder:
+    """Zbiera zdarzenia (subscribe) i paczki zapisu (on_save) ze store'a."""
+
+    def __init__(self):
+        self.events = []
+        self.saves = []
+
+    def on_event(self, event, task):
+        self.events.append((event, task))
+
+    def names(self):
+        return [event for event, _task in self.events]
+
+
+@pytest.fixture
+def rec():
+    return Recorder()
+
+
+@pytest.fixture
+def store(rec):
+    s = TaskStore(next_id=10, on_save=rec.saves.append)
+    s.subscribe(rec.on_event)
+    return s
+
+
+def _add(store, text, **kwargs):
+    kwargs.setdefault("due", TODAY)
+    kwargs.setdefault("meta", fmt_ddmm(kwargs["due"]))
+    return store.add(text, **kwargs)
+
+
+# ---------- operacje i zdarzenia ----------
+def test_add_emits_added_and_saves_new_row(store, rec):
+    t = _add(store, "matma")
+    assert rec.names() == ["added", "committed"]
+    assert t.db_id == 10
+    assert rec.saves == [{("tasks", 10): TaskStore.row_data(t)}]
+    assert store.on(TODAY) == [t]
+
+
+def test_toggle_star_delete(store, rec):
+    a = _add(store, "a")
+    b = _add(store, "b")
+    rec.events.clear()
+    rec.saves.clear()
+
+    store.toggle(a, True)
+    assert rec.events == [("changed", a), ("committed", None)]
+    assert rec.saves[-1] == {("tasks", a.db_id): TaskStore.row_data(a)}
+
+    store.star(b, True)  # przypięte idą na górę listy
+    assert store.items() == [b, a]
+
+    store.delete(a)
+    assert rec.events[-2:] == [("removed", a), ("committed", None)]
+    assert rec.saves[-1] == {("tasks", a.db_id): None}
+    assert a not in store and store.on(TODAY) == [b]
+
+    store.delete(a)  # drugi raz – nic się nie dzieje
+    assert rec.events[-1] == ("committed", None) and len(rec.saves) == 3
+
+
+def test_loaded_rows_are_not_saved_again(store, rec):
+    store.add("z bazy", db_id=3, created_seq=0)
+    assert rec.saves == []
+    assert rec.names() == ["added", "committed"]
+
+
+# ---------- batch() ----------
+def test_batch_coalesces_saves_and_commits(store, rec):
+    with store.batch():
+        a = _add(store, "a")
+        b = _add(store, "b")
+        store.toggle(a, True)
+        store.delete(b)
+        assert rec.saves == [] and "committed" not in rec.names()
+
+    assert rec.names() == ["added", "added", "changed", "removed", "committed"]
+    # b powstało i zniknęło w tej samej paczce: zostaje samo usunięcie po id
+    assert rec.saves == [{("tasks", a.db_id): TaskStore.row_data(a), ("tasks", b.db_id): None}]
+
+
+def test_nested_batch_flushes_once(store, rec):
+    with store.batch():
+        with store.batch():
+            _add(store, "a")
+        assert rec.saves == []
+    assert len(rec.saves) == 1 and rec.names().count("committed") == 1
+
+
+def test_batch_without_changes_emits_nothing(store, rec):
+    with store.batch():
+        pass
+    assert rec.events == [] and rec.saves == []
+
+
+# ---------- operacje hurtowe ----------
+def test_delete_done_sends_one_bulk_key(store, rec):
+    saved = [store.add(f"z bazy {i}", done=i % 2 == 0, db_id=i, created_seq=i) for i in range(1, 7)]
+    rec.saves.clear()
+
+    store.delete_done()
+    (changes,) = rec.saves
+    assert list(changes) == [("bulk", "done")]
+    assert [t.db_id for t in store] == [t.db_id for t in saved if not t.is_done()]
+
+
+def test_delete_done_deletes_unsaved_done_rows_by_id(store, rec):
+    a = store.add("z bazy", db_id=1, created_seq=0)
+    rec.saves.clear()
+    with store.batch():
+        store.toggle(a, True)   # baza jeszcze nie wie, że a jest zrobione
+        store.delete_done()
+        b = _add(store, "po usunięciu")
+
+    (changes,) = rec.saves
+    keys = list(changes)
+    assert keys[0] == ("bulk", "done")  # najpierw operacja hurtowa, potem reszta paczki
+    assert changes[("tasks", a.db_id)] is None
+    assert changes[("tasks", b.db_id)] == TaskStore.row_data(b)
+    assert list(store) == [b]
+
+
+def test_delete_done_series_occurrence_becomes_exception(store, rec):
+    series = store.add_series("trening", "Sport", "Codziennie", TODAY)
+    occ = store.on(store.window()[0])[0]
+    store.toggle(occ, True)
+    rec.saves.clear()
+
+    store.delete_done()
+    (changes,) = rec.saves
+    assert ("bulk", "done") not in changes  # zwykłych zadań do usunięcia nie było
+    assert occ.due in series.exceptions
+    assert changes[("series", series.db_id)] == series.to_data()
+
+
+def test_clear_removes_tasks_and_series(store, rec):
+    store.add("z bazy", db_id=1, created_seq=0)
+    store.add_series("trening", "Sport", "Codziennie", TODAY)
+    rec.saves.clear()
+    rec.events.clear()
+
+    with store.batch():
+        store.clear()
+        c = _add(store, "po czyszczeniu")
+
+    (changes,) = rec.saves
+    assert list(changes) == [("bulk", "all"), ("tasks", c.db_id)]
+    assert list(store) == [c] and store.series == {}
+    assert rec.names().count("committed") == 1
+
+
+# ---------- load / load_iter ----------
+def _rows(n, today=TODAY):
+    return [
+        {
+            "id": i + 1, "text": f"zadanie {i}", "done": False, "cat": "Inne",
+            "meta": fmt_ddmm(today), "star": i % 10 == 0, "created_seq": i,
+            "rep": False, "time": None, "due_date": today.isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+def test_load_skips_past_rows_and_saves_nothing(store, rec):
+    rows = _rows(3)
+    rows[1]["due_date"] = (TODAY - timedelta(days=1)).isoformat()
+    store.load(rows, today=TODAY)
+    assert sorted(t.db_id for t in store) == [1, 3]
+    assert rec.saves == []
+    assert rec.names().count("committed") == 1
+
+
+def test_load_iter_chunks_with_add_in_between(store, rec):
+    rows = _rows(25)
+    store.reserve_ids(26, 1)  # jak w aplikacji: następne wolne id z bazy
+    steps = store.load_iter(rows, today=TODAY, chunk=10)
+    progress = [next(steps), next(steps)]
+    assert progress == [0, 10] and len(store) == 10
+
+    new = _add(store, "dodane w trakcie")   # między kawałkami
+    progress += list(steps)
+    assert progress == [0, 10, 20, 25]
+
+    assert len(store) == 26
+    assert new.db_id == 26                   # nie koliduje z wierszami z dalszych kawałków
+    assert new.created_seq == 25             # i na końcu kolejności
+    assert store.items()[-1] is new
+    # do zapisu poszło tylko nowe zadanie (wczytane wiersze są już w bazie)
+    assert [list(c) for c in rec.saves] == [[("tasks", new.db_id)]]
+
+
+def test_load_iter_matches_load(rec):
+    rows = _rows(30)
+    whole = TaskStore()
+    whole.load(rows, today=TODAY)
+    chunked = TaskStore()
+    for _loaded in chunked.load_iter(rows, today=TODAY, chunk=7):
+        pass
+    assert [t.db_id for t in chunked.items()] == [t.db_id for t in whole.items()]